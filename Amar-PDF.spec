@@ -36,7 +36,7 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['test_imports'],  # developer script, not part of the app
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
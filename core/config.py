@@ -1,6 +1,6 @@
 """
 Application configuration and settings
-Contains runtime configurable settings (as opposed to constants.py which has fixed values)
+Contains runtime configurable settings (as opposed to core/constants/ which has fixed values)
 """
 
 class Config:
@@ -8,6 +8,10 @@ All constants are re-exported here for backward compatibility.
 # Rendering constants
 from core.constants.rendering import (
     BASE_SCALE,
+    PAGE_CACHE_LIMIT_KB,
+    PREFETCH_DELAY_MS,
+    STORE_SHRINK_INTERVAL,
+    STORE_SHRINK_PERCENT,
     MIN_ZOOM,
     MAX_ZOOM,
     DEFAULT_ZOOM,
@@ -15,7 +19,8 @@ from core.constants.rendering import (
     ZOOM_SLIDER_MAX,
     ZOOM_SLIDER_DEFAULT,
     ZOOM_SLIDER_TICK_INTERVAL,
-    ZOOM_SLIDER_WIDTH
+    ZOOM_SLIDER_WIDTH,
+    ZOOM_DEBOUNCE_MS
 )
 
 # UI constants
@@ -25,6 +30,10 @@ from core.constants.ui import (
     DECORATION_HEIGHT,
     DECORATION_WIDTH,
     MIN_ANNOTATION_SIZE,
+    RESIZE_SKIP_THRESHOLD,
+    HIT_TEST_BIN_SIZE,
+    HIT_TEST_GRID_MIN_ANNOTATIONS,
+    REPAINT_MARGIN,
     MIN_BUTTON_HEIGHT,
     BUTTON_HEIGHT_PADDING,
     DEFAULT_MENUBAR_HEIGHT
@@ -33,12 +42,15 @@ from core.constants.ui import (
 # Text constants
 from core.constants.text import (
     DEFAULT_FONT,
+    COMMON_FONTS,
+    MORE_FONTS_LABEL,
     DEFAULT_FONT_SIZE,
     MIN_FONT_SIZE,
     MAX_FONT_SIZE,
     TEXT_ANNOTATION_WIDTH_PADDING,
     TEXT_ANNOTATION_HEIGHT_PADDING,
-    TEXT_ANNOTATION_Y_OFFSET
+    TEXT_ANNOTATION_Y_OFFSET,
+    TEXT_ADVANCE_CACHE_SIZE
 )
 
 # Drawing constants
@@ -48,7 +60,10 @@ from core.constants.drawing import (
     MAX_PEN_WIDTH,
     CANVAS_WIDTH,
     CANVAS_HEIGHT,
-    DOODLE_PADDING
+    DOODLE_PADDING,
+    DOODLE_UNDO_LIMIT,
+    STROKE_SIMPLIFY_EPSILON,
+    STROKE_SIMPLIFY_MIN_POINTS
 )
 
 # Cursor constants
@@ -61,6 +76,10 @@ from core.constants.cursors import (
 __all__ = [
     # Rendering
     'BASE_SCALE',
+    'PAGE_CACHE_LIMIT_KB',
+    'PREFETCH_DELAY_MS',
+    'STORE_SHRINK_INTERVAL',
+    'STORE_SHRINK_PERCENT',
     'MIN_ZOOM',
     'MAX_ZOOM',
     'DEFAULT_ZOOM',
@@ -69,23 +88,31 @@ __all__ = [
     'ZOOM_SLIDER_DEFAULT',
     'ZOOM_SLIDER_TICK_INTERVAL',
     'ZOOM_SLIDER_WIDTH',
+    'ZOOM_DEBOUNCE_MS',
     # UI
     'EDGE_RESIZE_THRESHOLD',
     'WINDOW_MARGIN',
     'DECORATION_HEIGHT',
     'DECORATION_WIDTH',
     'MIN_ANNOTATION_SIZE',
+    'RESIZE_SKIP_THRESHOLD',
+    'HIT_TEST_BIN_SIZE',
+    'HIT_TEST_GRID_MIN_ANNOTATIONS',
+    'REPAINT_MARGIN',
     'MIN_BUTTON_HEIGHT',
     'BUTTON_HEIGHT_PADDING',
     'DEFAULT_MENUBAR_HEIGHT',
     # Text
     'DEFAULT_FONT',
+    'COMMON_FONTS',
+    'MORE_FONTS_LABEL',
     'DEFAULT_FONT_SIZE',
     'MIN_FONT_SIZE',
     'MAX_FONT_SIZE',
     'TEXT_ANNOTATION_WIDTH_PADDING',
     'TEXT_ANNOTATION_HEIGHT_PADDING',
     'TEXT_ANNOTATION_Y_OFFSET',
+    'TEXT_ADVANCE_CACHE_SIZE',
     # Drawing
     'DEFAULT_PEN_WIDTH',
     'MIN_PEN_WIDTH',
@@ -93,6 +120,9 @@ __all__ = [
     'CANVAS_WIDTH',
     'CANVAS_HEIGHT',
     'DOODLE_PADDING',
+    'DOODLE_UNDO_LIMIT',
+    'STROKE_SIMPLIFY_EPSILON',
+    'STROKE_SIMPLIFY_MIN_POINTS',
     # Cursors
     'TEXT_MODE_CURSOR',
     'IMAGE_MODE_CURSOR',
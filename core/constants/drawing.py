@@ -11,3 +11,8 @@ MAX_PEN_WIDTH = 20
 CANVAS_WIDTH = 600
 CANVAS_HEIGHT = 400
 DOODLE_PADDING = 10
+DOODLE_UNDO_LIMIT = 32  # canvas snapshots kept for undo
+
+# Stroke simplification (Ramer-Douglas-Peucker)
+STROKE_SIMPLIFY_EPSILON = 0.5  # max deviation in pixels for dropped points
+STROKE_SIMPLIFY_MIN_POINTS = 16  # shorter strokes are kept as drawn
@@ -4,6 +4,10 @@ Rendering-related constants
 
 # PDF Rendering
 BASE_SCALE = 2.0  # Base DPI scaling for PDF rendering
+PAGE_CACHE_LIMIT_KB = 256 * 1024  # QPixmapCache budget for rendered pages
+PREFETCH_DELAY_MS = 200  # idle time before neighbouring pages are pre-rendered
+STORE_SHRINK_INTERVAL = 8  # page renders between partial trims of MuPDF's resource store
+STORE_SHRINK_PERCENT = 50  # share of MuPDF's resource store released by each periodic trim
 
 # Zoom levels
 MIN_ZOOM = 0.25   # 25%
@@ -16,3 +20,4 @@ ZOOM_SLIDER_MAX = 400  # 400%
 ZOOM_SLIDER_DEFAULT = 100  # 100%
 ZOOM_SLIDER_TICK_INTERVAL = 25
 ZOOM_SLIDER_WIDTH = 200
+ZOOM_DEBOUNCE_MS = 150  # slider must rest this long before the page is re-rendered
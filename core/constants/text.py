@@ -4,6 +4,8 @@ Text and font-related constants
 
 # Fonts
 DEFAULT_FONT = "Arial"
+COMMON_FONTS = ["Arial", "Helvetica", "Times New Roman", "Courier New", "Georgia", "Verdana"]
+MORE_FONTS_LABEL = "Other..."  # font list entry that loads every installed family
 DEFAULT_FONT_SIZE = 12
 MIN_FONT_SIZE = 6
 MAX_FONT_SIZE = 72
@@ -12,3 +14,4 @@ MAX_FONT_SIZE = 72
 TEXT_ANNOTATION_WIDTH_PADDING = 10
 TEXT_ANNOTATION_HEIGHT_PADDING = 6
 TEXT_ANNOTATION_Y_OFFSET = 4
+TEXT_ADVANCE_CACHE_SIZE = 2000  # measured (text, style) widths kept for reuse
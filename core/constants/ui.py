@@ -8,6 +8,10 @@ WINDOW_MARGIN = 50  # pixels margin from screen edge
 DECORATION_HEIGHT = 40  # window title bar height
 DECORATION_WIDTH = 20  # window border width
 MIN_ANNOTATION_SIZE = 10  # minimum width/height for annotations
+RESIZE_SKIP_THRESHOLD = 8  # window size changes below this many pixels are ignored
+HIT_TEST_BIN_SIZE = 64  # grid cell size in pixels for annotation hit-testing
+HIT_TEST_GRID_MIN_ANNOTATIONS = 20  # pages with fewer annotations are hit-tested by a plain scan
+REPAINT_MARGIN = 4  # pixels repainted around an annotation's rect (border pen, antialiasing)
 
 # Button Heights
 MIN_BUTTON_HEIGHT = 40
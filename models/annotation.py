@@ -7,6 +7,8 @@ from abc import ABC, abstractmethod
 
 class Annotation(ABC):
     """Base class for all annotation types"""
+    __slots__ = ('x', 'y', 'page_num', 'created_at_zoom')
+
     def __init__(self, x, y, page_num):
         self.x = x
         self.y = y
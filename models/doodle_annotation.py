@@ -2,8 +2,8 @@
 Doodle annotation model
 """
 
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QPen
-from PyQt5.QtCore import QRect, Qt
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QPen, QPolygon
+from PyQt5.QtCore import QPoint, QRect, Qt
 from typing import TYPE_CHECKING
 
 from core.constants import DOODLE_PADDING
@@ -28,6 +28,8 @@ class DoodleAnnotation(Annotation):
     def __init__(self, x, y, page_num, drawing_data: 'DrawingData', width=None, height=None):
         super().__init__(x, y, page_num)
         self.drawing_data = drawing_data  # DrawingData object
+        self._scaled_pixmap = None
+        self._scaled_pixmap_key = None
 
         # Set dimensions - use provided dimensions or calculate from drawing
         if width is None or height is None:
@@ -81,16 +83,15 @@ class DoodleAnnotation(Annotation):
             painter.setPen(pen)
 
             points = stroke.points
-            for i in range(len(points) - 1):
-                # Offset points to start from (0, 0)
-                x1, y1 = points[i]
-                x2, y2 = points[i + 1]
-                painter.drawLine(
-                    int(x1 - min_x + DOODLE_PADDING),
-                    int(y1 - min_y + DOODLE_PADDING),
-                    int(x2 - min_x + DOODLE_PADDING),
-                    int(y2 - min_y + DOODLE_PADDING)
-                )
+            if len(points) < 2:
+                continue
+
+            # Offset points to start from (0, 0) and draw the stroke in one call
+            polygon = QPolygon([
+                QPoint(int(x - min_x + DOODLE_PADDING), int(y - min_y + DOODLE_PADDING))
+                for x, y in points
+            ])
+            painter.drawPolyline(polygon)
 
         painter.end()
         return QPixmap.fromImage(image)
@@ -109,7 +110,13 @@ class DoodleAnnotation(Annotation):
         zoom_ratio = self._get_zoom_ratio(current_zoom)
         scaled_width = int(self.width * zoom_ratio)
         scaled_height = int(self.height * zoom_ratio)
-        return self.pixmap.scaled(scaled_width, scaled_height)
+
+        # Rescale only when the target size or the source pixmap changed
+        key = (self.pixmap.cacheKey(), scaled_width, scaled_height)
+        if self._scaled_pixmap_key != key:
+            self._scaled_pixmap = self.pixmap.scaled(scaled_width, scaled_height)
+            self._scaled_pixmap_key = key
+        return self._scaled_pixmap
 
     @classmethod
     def from_drawing_data(cls, x: float, y: float, page_num: int,
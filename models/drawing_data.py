@@ -2,8 +2,9 @@
 Drawing data model for doodle strokes
 """
 
+import math
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 from PyQt5.QtGui import QColor
 from PyQt5.QtCore import QPoint
 
@@ -76,6 +77,23 @@ class Stroke:
         color = (qcolor.red(), qcolor.green(), qcolor.blue())
         return cls(points=points, color=color, width=width)
 
+    @classmethod
+    def from_flat_coords(cls, coords: Sequence[int], qcolor: QColor, width: int) -> 'Stroke':
+        """
+        Create a Stroke from interleaved coordinates.
+
+        Args:
+            coords: Flat sequence x0, y0, x1, y1, ... (e.g. an array.array('h'))
+            qcolor: QColor object
+            width: Pen width in pixels
+
+        Returns:
+            Stroke instance with converted data
+        """
+        points = list(zip(coords[0::2], coords[1::2]))
+        color = (qcolor.red(), qcolor.green(), qcolor.blue())
+        return cls(points=points, color=color, width=width)
+
     def to_qpoints(self) -> List[QPoint]:
         """
         Convert stroke points to QPoint objects.
@@ -94,6 +112,47 @@ class Stroke:
         """
         return QColor(*self.color)
 
+    def simplify(self, epsilon: float) -> None:
+        """
+        Drop points that deviate less than epsilon from the simplified path.
+
+        Uses the Ramer-Douglas-Peucker algorithm; the first and last points
+        are always kept.
+
+        Args:
+            epsilon: Maximum allowed deviation in pixels
+        """
+        points = self.points
+        if len(points) < 3:
+            return
+
+        keep = [False] * len(points)
+        keep[0] = keep[-1] = True
+        ranges = [(0, len(points) - 1)]
+        while ranges:
+            first, last = ranges.pop()
+            x0, y0 = points[first]
+            dx = points[last][0] - x0
+            dy = points[last][1] - y0
+            length = math.hypot(dx, dy)
+
+            max_dist, index = 0.0, first
+            for i in range(first + 1, last):
+                px, py = points[i]
+                if length:
+                    dist = abs(dy * (px - x0) - dx * (py - y0)) / length
+                else:
+                    dist = math.hypot(px - x0, py - y0)
+                if dist > max_dist:
+                    max_dist, index = dist, i
+
+            if max_dist > epsilon:
+                keep[index] = True
+                ranges.append((first, index))
+                ranges.append((index, last))
+
+        self.points = [point for point, kept in zip(points, keep) if kept]
+
 
 @dataclass
 class DrawingData:
@@ -135,6 +194,11 @@ class DrawingData:
             raise TypeError(f"Expected Stroke instance, got {type(stroke)}")
         self.strokes.append(stroke)
 
+    def remove_last_stroke(self) -> None:
+        """Remove the most recently added stroke, if any"""
+        if self.strokes:
+            self.strokes.pop()
+
     def clear(self) -> None:
         """Remove all strokes from the drawing"""
         self.strokes.clear()
@@ -10,12 +10,14 @@ from models.annotation import Annotation
 
 class ImageAnnotation(Annotation):
     """Represents an image annotation in draft mode"""
-    def __init__(self, x, y, image_path, page_num, width=None, height=None):
+    def __init__(self, x, y, image_path, page_num, width=None, height=None, image=None):
         super().__init__(x, y, page_num)
         self.image_path = image_path
+        self._scaled_pixmap = None
+        self._scaled_pixmap_key = None
 
-        # Load the image
-        self.pixmap = QPixmap(image_path)
+        # Load the image, unless it was already decoded (e.g. by ImageLoadTask)
+        self.pixmap = QPixmap.fromImage(image) if image is not None else QPixmap(image_path)
 
         # Set dimensions - default to original size
         if width is None or height is None:
@@ -40,7 +42,13 @@ class ImageAnnotation(Annotation):
         zoom_ratio = self._get_zoom_ratio(current_zoom)
         scaled_width = int(self.width * zoom_ratio)
         scaled_height = int(self.height * zoom_ratio)
-        return self.pixmap.scaled(scaled_width, scaled_height)
+
+        # Rescale only when the target size or the source pixmap changed
+        key = (self.pixmap.cacheKey(), scaled_width, scaled_height)
+        if self._scaled_pixmap_key != key:
+            self._scaled_pixmap = self.pixmap.scaled(scaled_width, scaled_height)
+            self._scaled_pixmap_key = key
+        return self._scaled_pixmap
 
     @classmethod
     def from_file(cls, x: float, y: float, image_path: str, page_num: int) -> 'ImageAnnotation':
@@ -2,21 +2,68 @@
 Text annotation model
 """
 
+import functools
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Tuple
-from PyQt5.QtGui import QFont, QFontMetrics, QColor
-from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QFont, QFontMetrics, QColor, QStaticText, QTransform
+from PyQt5.QtCore import Qt, QRect
 
 from core.constants import (BASE_SCALE, DEFAULT_FONT, DEFAULT_FONT_SIZE,
                              TEXT_ANNOTATION_WIDTH_PADDING, TEXT_ANNOTATION_HEIGHT_PADDING,
-                             TEXT_ANNOTATION_Y_OFFSET)
+                             TEXT_ANNOTATION_Y_OFFSET, TEXT_ADVANCE_CACHE_SIZE)
 from models.annotation import Annotation
 
 if TYPE_CHECKING:
     from models.text_format import TextFormat
 
 
+@functools.lru_cache(maxsize=256)
+def _font_and_metrics(family, point_size, bold, italic, underline, strikethrough):
+    """
+    Get a formatted QFont and its metrics, shared by all annotations in that style.
+
+    Measuring is the hot path while dragging and repainting, and annotations on
+    a page usually share a handful of styles.
+    """
+    font = QFont(family, point_size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    font.setUnderline(underline)
+    font.setStrikeOut(strikethrough)
+    return font, QFontMetrics(font)
+
+
+# Measured text widths by (text, font style), least recently used first
+_ADVANCE_CACHE = OrderedDict()
+
+
+def _text_advance(text, style):
+    """
+    Get the horizontal advance of text in a font style, measuring it on a miss.
+
+    Args:
+        text: Text to measure
+        style: Arguments for _font_and_metrics()
+    """
+    key = (text, style)
+    advance = _ADVANCE_CACHE.get(key)
+    if advance is None:
+        _, metrics = _font_and_metrics(*style)
+        advance = _ADVANCE_CACHE[key] = metrics.horizontalAdvance(text)
+        if len(_ADVANCE_CACHE) > TEXT_ADVANCE_CACHE_SIZE:
+            _ADVANCE_CACHE.popitem(last=False)
+    else:
+        _ADVANCE_CACHE.move_to_end(key)
+    return advance
+
+
 class TextAnnotation(Annotation):
     """Represents a text annotation in draft mode"""
+    # No per-instance __dict__: annotations are read in every hit-test and paint
+    __slots__ = ('text', 'font_family', 'font_size', 'bold', 'italic', 'underline',
+                 'strikethrough', 'color', 'width', 'height', '_rect', '_rect_key',
+                 '_static_text', '_static_text_key')
+
     def __init__(self, x, y, text, page_num, font_family=DEFAULT_FONT, font_size=DEFAULT_FONT_SIZE,
                  bold=False, italic=False, underline=False, strikethrough=False,
                  color: Tuple[int, int, int] = (0, 0, 0)):
@@ -29,34 +76,69 @@ class TextAnnotation(Annotation):
         self.underline = underline
         self.strikethrough = strikethrough
         self.color = color  # RGB tuple (r, g, b)
+        self._rect = None  # bounding rect from the last get_rect() call
+        self._rect_key = None  # position, zoom and formatting _rect was computed for
+        self._static_text = None  # laid-out text for painting, see get_static_text()
+        self._static_text_key = None
         self.update_bounds()
 
     def update_bounds(self, zoom_level=1.0):
         """Calculate bounding box for the text at given zoom level"""
-        font = self.get_qfont(zoom_level)
-        metrics = QFontMetrics(font)
-        self.width = metrics.horizontalAdvance(self.text) + TEXT_ANNOTATION_WIDTH_PADDING
+        self._rect_key = None
+        style = self._font_style(zoom_level)
+        _, metrics = _font_and_metrics(*style)
+        self.width = _text_advance(self.text, style) + TEXT_ANNOTATION_WIDTH_PADDING
         self.height = metrics.height() + TEXT_ANNOTATION_HEIGHT_PADDING
 
     def get_qfont(self, zoom_level=1.0):
         """Get QFont object with all formatting applied for base scaled display with zoom"""
+        font, _ = _font_and_metrics(*self._font_style(zoom_level))
+        # Copy so callers can't alter the shared cached font
+        return QFont(font)
+
+    def get_static_text(self, zoom_level=1.0):
+        """
+        Get the text laid out for painting at a zoom level.
+
+        The layout is kept until the text or formatting changes, so repaints
+        (drag, scroll) don't shape the string again.
+        """
+        style = self._font_style(zoom_level)
+        key = (self.text, style)
+        if self._static_text_key != key:
+            font, _ = _font_and_metrics(*style)
+            self._static_text = QStaticText(self.text)
+            self._static_text.setTextFormat(Qt.PlainText)
+            self._static_text.prepare(QTransform(), font)
+            self._static_text_key = key
+        return self._static_text
+
+    def _font_style(self, zoom_level):
+        """Get the font cache key for this annotation's formatting at a zoom level"""
         # Font size needs to be BASE_SCALE for the scaled PDF display, then apply zoom
         display_font_size = self.font_size * BASE_SCALE * zoom_level
-        font = QFont(self.font_family, int(display_font_size))
-        font.setBold(self.bold)
-        font.setItalic(self.italic)
-        font.setUnderline(self.underline)
-        font.setStrikeOut(self.strikethrough)
-        return font
+        return (self.font_family, int(display_font_size), bool(self.bold),
+                bool(self.italic), bool(self.underline), bool(self.strikethrough))
 
     def get_rect(self, current_zoom=1.0):
-        """Get the bounding rectangle at given zoom level"""
-        # Scale coordinates from creation zoom to current zoom
-        scaled_x, scaled_y = self._get_scaled_position(current_zoom)
+        """
+        Get the bounding rectangle at given zoom level.
 
-        # Recalculate bounds for current zoom
-        self.update_bounds(current_zoom)
-        return QRect(int(scaled_x), int(scaled_y - self.height + TEXT_ANNOTATION_Y_OFFSET), int(self.width), int(self.height))
+        The rect is reused until the position, zoom or formatting changes,
+        so callers must not modify it.
+        """
+        key = (current_zoom, self.x, self.y, self.created_at_zoom, self.text, self.font_family,
+               self.font_size, self.bold, self.italic, self.underline, self.strikethrough)
+        if self._rect_key != key:
+            # Scale coordinates from creation zoom to current zoom
+            scaled_x, scaled_y = self._get_scaled_position(current_zoom)
+
+            # Recalculate bounds for current zoom
+            self.update_bounds(current_zoom)
+            self._rect = QRect(int(scaled_x), int(scaled_y - self.height + TEXT_ANNOTATION_Y_OFFSET),
+                               int(self.width), int(self.height))
+            self._rect_key = key
+        return self._rect
 
     def get_qcolor(self) -> QColor:
         """
@@ -5,5 +5,6 @@ Contains PDF and window management operations
 
 from operations.pdf_operations import PDFOperations
 from operations.window_manager import WindowManager
+from operations.image_loader import ImageLoadTask
 
-__all__ = ['PDFOperations', 'WindowManager']
+__all__ = ['PDFOperations', 'WindowManager', 'ImageLoadTask']
@@ -0,0 +1,39 @@
+"""
+Background image decoding
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader
+
+
+class ImageLoadSignals(QObject):
+    """Signals emitted by ImageLoadTask"""
+    loaded = pyqtSignal(object, str, QImage)  # context, image path, decoded image
+    failed = pyqtSignal(object, str, str)  # context, image path, error message
+
+
+class ImageLoadTask(QRunnable):
+    """
+    Decode an image file on a QThreadPool worker.
+
+    QImage, unlike QPixmap, may be created outside the GUI thread, so the
+    file is decoded here and converted to a QPixmap by whoever receives
+    the loaded signal on the GUI thread.
+
+    Args:
+        image_path: Path to the image file
+        context: Arbitrary value passed back with the result (e.g. click position)
+    """
+    def __init__(self, image_path, context=None):
+        super().__init__()
+        self.image_path = image_path
+        self.context = context
+        self.signals = ImageLoadSignals()
+
+    def run(self):
+        reader = QImageReader(self.image_path)
+        image = reader.read()
+        if image.isNull():
+            self.signals.failed.emit(self.context, self.image_path, reader.errorString())
+        else:
+            self.signals.loaded.emit(self.context, self.image_path, image)
@@ -3,24 +3,101 @@ PDF file operations and rendering
 """
 
 import fitz  # PyMuPDF
+import itertools
 import tempfile
 from PyQt5.QtGui import QImage, QPixmap
-from core.constants import BASE_SCALE
+from core.constants import BASE_SCALE, STORE_SHRINK_INTERVAL, STORE_SHRINK_PERCENT
 from models import TextAnnotation, ImageAnnotation, DoodleAnnotation
 
+# Counts page renders so MuPDF's resource store can be trimmed periodically
+_RENDER_COUNTER = itertools.count(1)
+
+# Common font families mapped to PyMuPDF base font names
+_FONT_MAP = {
+    'Times New Roman': 'Times',
+    'Courier New': 'Courier',
+    'Arial': 'Helvetica'
+}
+
+# Base-14 font names by family and (bold, italic); these are built into MuPDF,
+# so insert_text accepts them without a font file
+_BASE14_FONTNAMES = {
+    'Helvetica': {
+        (False, False): 'Helvetica',
+        (True, False): 'Helvetica-Bold',
+        (False, True): 'Helvetica-Oblique',
+        (True, True): 'Helvetica-BoldOblique'
+    },
+    'Times': {
+        (False, False): 'Times-Roman',
+        (True, False): 'Times-Bold',
+        (False, True): 'Times-Italic',
+        (True, True): 'Times-BoldItalic'
+    },
+    'Courier': {
+        (False, False): 'Courier',
+        (True, False): 'Courier-Bold',
+        (False, True): 'Courier-Oblique',
+        (True, True): 'Courier-BoldOblique'
+    }
+}
+
+# Resolved base-14 font name by (font family, bold, italic)
+_RESOLVED_FONTNAMES = {}
+
+
+def _resolve_fontname(font_family, bold, italic):
+    """
+    Get the base-14 PDF font name for a text style.
+
+    Families without a base-14 equivalent fall back to Helvetica in the same
+    style. Results are memoized per style.
+    """
+    style_key = (font_family, bold, italic)
+    fontname = _RESOLVED_FONTNAMES.get(style_key)
+    if fontname is None:
+        # Map common font families to PyMuPDF base fonts
+        base_fontname = _FONT_MAP.get(font_family, font_family)
+        styles = _BASE14_FONTNAMES.get(base_fontname, _BASE14_FONTNAMES['Helvetica'])
+        fontname = _RESOLVED_FONTNAMES[style_key] = styles[(bold, italic)]
+    return fontname
+
 
 class PDFOperations:
     """Mixin class for PDF operations"""
 
     def open_pdf_file(self, path):
-        """Open a PDF file and return the document"""
+        """
+        Open a PDF file and return the document
+
+        fitz.open() only reads the trailer and xref table; page content is
+        parsed when a page is first loaded, so callers should avoid touching
+        pages beyond the one being displayed.
+        """
         return fitz.open(path)
 
+    def trim_render_store(self):
+        """Empty MuPDF's global resource cache after a heavy document operation"""
+        # PyMuPDF doesn't report the store size (TOOLS.store_size() returns None),
+        # so the store is emptied outright; fonts and images are re-decoded on demand
+        fitz.TOOLS.store_shrink(100)
+
     def render_page(self, page, zoom_factor):
         """Render a PDF page at given zoom factor and return QPixmap"""
-        pix = page.get_pixmap(matrix=fitz.Matrix(zoom_factor, zoom_factor))
-        image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
-        return QPixmap.fromImage(image)
+        matrix = fitz.Matrix(zoom_factor, zoom_factor)
+        # Page pixels are opaque; annotations are painted on top by Qt, so skip the alpha byte
+        pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csRGB, alpha=False)
+        # Wrap MuPDF's buffer without copying it to bytes. fromImage() must keep its
+        # default conversion: that is what gives the pixmap its own pixel buffer,
+        # whereas NoFormatConversion would share pix's memory beyond its lifetime.
+        image = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
+        pixmap = QPixmap.fromImage(image)
+
+        # MuPDF keeps decoded fonts and images in an unbounded global store; release
+        # part of it every few renders so browsing image-heavy files stays bounded
+        if next(_RENDER_COUNTER) % STORE_SHRINK_INTERVAL == 0:
+            fitz.TOOLS.store_shrink(STORE_SHRINK_PERCENT)
+        return pixmap
 
     def save_pdf_with_annotations(self, doc, annotations):
         """
@@ -30,174 +107,138 @@ class PDFOperations:
             doc: PyMuPDF document
             annotations: List of TextAnnotation and ImageAnnotation objects
         """
-        for annotation in annotations:
-            page = doc[annotation.page_num]
-            zoom_at_creation = getattr(annotation, 'created_at_zoom', 1.0)
-
-            if isinstance(annotation, TextAnnotation):
-                from core.constants import TEXT_ANNOTATION_Y_OFFSET
-
-                # Convert screen coordinates to PDF coordinates
-                pdf_x = annotation.x / (BASE_SCALE * zoom_at_creation)
-                pdf_y = annotation.y / (BASE_SCALE * zoom_at_creation)
-
-                # X adjustment: In preview, text has 5px left padding inside the rect
-                # Convert to PDF space (5px at BASE_SCALE display)
-                x_padding_pdf = 5.0 / BASE_SCALE
-                pdf_x = pdf_x + x_padding_pdf
-
-                # Y adjustment: annotation.height is calculated at zoom=1.0 with BASE_SCALE font
-                # So it's in screen pixels at BASE_SCALE * 1.0
-                # Convert height to PDF space
-                height_pdf = annotation.height / BASE_SCALE
-
-                # In preview: rect_top = y - height + TEXT_ANNOTATION_Y_OFFSET (in original coords)
-                rect_top_original = pdf_y - height_pdf + (TEXT_ANNOTATION_Y_OFFSET / BASE_SCALE)
-
-                # For PDF baseline positioning:
-                # Qt's AlignVCenter centers the text visually in the rect
-                # PDF's insert_text places text at baseline
-                # The baseline should be lower than center - around 65% down from top
-                # This accounts for the fact that most glyphs sit above the baseline
-                pdf_y = rect_top_original + (height_pdf * 0.65)
-
-                # Build font name with style modifiers
-                fontname = annotation.font_family
-                # Map common font families to PyMuPDF base fonts
-                font_map = {
-                    'Times New Roman': 'Times',
-                    'Courier New': 'Courier',
-                    'Arial': 'Helvetica'
-                }
-                base_fontname = font_map.get(fontname, fontname)
-
-                # Convert RGB color from 0-255 range to 0-1 range for PyMuPDF
-                pdf_color = tuple(c / 255.0 for c in annotation.color)
-
-                # Try to insert text with formatting
-                text_inserted = False
-
-                # Attempt 1: Try with bold/italic modifiers
-                if annotation.bold or annotation.italic:
-                    styled_fontname = base_fontname
-                    if annotation.bold and annotation.italic:
-                        styled_fontname += '-BoldItalic'
-                    elif annotation.bold:
-                        styled_fontname += '-Bold'
-                    elif annotation.italic:
-                        styled_fontname += '-Italic'
-
-                    try:
-                        page.insert_text(
-                            (pdf_x, pdf_y),
-                            annotation.text,
-                            fontsize=annotation.font_size,
-                            fontname=styled_fontname,
-                            color=pdf_color
-                        )
-                        text_inserted = True
-                    except Exception as e:
-                        # Font with modifiers not available, will try base font
-                        pass
-
-                # Attempt 2: Try base font without modifiers
-                if not text_inserted:
-                    try:
-                        page.insert_text(
-                            (pdf_x, pdf_y),
-                            annotation.text,
-                            fontsize=annotation.font_size,
-                            fontname=base_fontname,
-                            color=pdf_color
-                        )
-                        text_inserted = True
-                    except Exception as e:
-                        # Base font not available, will try default
-                        pass
-
-                # Attempt 3: Fallback to Helvetica (always available)
-                if not text_inserted:
+        # Sort stably by page so each page is loaded once and keeps its annotation order
+        by_page = itertools.groupby(sorted(annotations, key=lambda a: a.page_num),
+                                    key=lambda a: a.page_num)
+        for page_num, page_annotations in by_page:
+            page = doc[page_num]
+
+            # Text and lines are queued on one Shape and written to the page's
+            # content stream in a single commit instead of one append per call
+            shape = page.new_shape()
+
+            for annotation in page_annotations:
+                zoom_at_creation = getattr(annotation, 'created_at_zoom', 1.0)
+
+                if isinstance(annotation, TextAnnotation):
+                    from core.constants import TEXT_ANNOTATION_Y_OFFSET
+
+                    # Convert screen coordinates to PDF coordinates
+                    pdf_x = annotation.x / (BASE_SCALE * zoom_at_creation)
+                    pdf_y = annotation.y / (BASE_SCALE * zoom_at_creation)
+
+                    # X adjustment: In preview, text has 5px left padding inside the rect
+                    # Convert to PDF space (5px at BASE_SCALE display)
+                    x_padding_pdf = 5.0 / BASE_SCALE
+                    pdf_x = pdf_x + x_padding_pdf
+
+                    # Y adjustment: annotation.height is calculated at zoom=1.0 with BASE_SCALE font
+                    # So it's in screen pixels at BASE_SCALE * 1.0
+                    # Convert height to PDF space
+                    height_pdf = annotation.height / BASE_SCALE
+
+                    # In preview: rect_top = y - height + TEXT_ANNOTATION_Y_OFFSET (in original coords)
+                    rect_top_original = pdf_y - height_pdf + (TEXT_ANNOTATION_Y_OFFSET / BASE_SCALE)
+
+                    # For PDF baseline positioning:
+                    # Qt's AlignVCenter centers the text visually in the rect
+                    # PDF's insert_text places text at baseline
+                    # The baseline should be lower than center - around 65% down from top
+                    # This accounts for the fact that most glyphs sit above the baseline
+                    pdf_y = rect_top_original + (height_pdf * 0.65)
+
+                    # Convert RGB color from 0-255 range to 0-1 range for PyMuPDF
+                    pdf_color = tuple(c / 255.0 for c in annotation.color)
+
+                    # The font name is pre-validated, so a failure here is a real error
+                    fontname = _resolve_fontname(annotation.font_family, bool(annotation.bold),
+                                                 bool(annotation.italic))
                     try:
-                        page.insert_text(
+                        shape.insert_text(
                             (pdf_x, pdf_y),
                             annotation.text,
                             fontsize=annotation.font_size,
-                            fontname='Helvetica',
+                            fontname=fontname,
                             color=pdf_color
                         )
                         text_inserted = True
                     except Exception as e:
+                        text_inserted = False
                         print(f"Failed to insert text annotation: {e}")
 
-                # Add underline and strikethrough (always drawn, regardless of font)
-                if text_inserted:
-                    # Calculate text width for underline/strikethrough
-                    # Use the actual font metrics from Qt (divided by base scale for PDF coordinates)
-                    text_width = annotation.width / BASE_SCALE
+                    # Add underline and strikethrough (always drawn, regardless of font)
+                    if text_inserted and (annotation.underline or annotation.strikethrough):
+                        # Calculate text width for underline/strikethrough
+                        # Use the actual font metrics from Qt (divided by base scale for PDF coordinates)
+                        text_width = annotation.width / BASE_SCALE
 
-                    # Add underline if needed
-                    if annotation.underline:
-                        underline_y = pdf_y + 1.5
-                        try:
-                            page.draw_line(
+                        # Add underline if needed
+                        if annotation.underline:
+                            underline_y = pdf_y + 1.5
+                            shape.draw_line(
                                 (pdf_x, underline_y),
-                                (pdf_x + text_width - 5, underline_y),
-                                color=pdf_color,
-                                width=0.5
+                                (pdf_x + text_width - 5, underline_y)
                             )
-                        except Exception as e:
-                            print(f"Failed to add underline: {e}")
 
-                    # Add strikethrough if needed
-                    if annotation.strikethrough:
-                        strikethrough_y = pdf_y - (annotation.font_size * 0.35)
-                        try:
-                            page.draw_line(
+                        # Add strikethrough if needed
+                        if annotation.strikethrough:
+                            strikethrough_y = pdf_y - (annotation.font_size * 0.35)
+                            shape.draw_line(
                                 (pdf_x, strikethrough_y),
-                                (pdf_x + text_width - 5, strikethrough_y),
-                                color=pdf_color,
-                                width=0.5
+                                (pdf_x + text_width - 5, strikethrough_y)
                             )
+
+                        # Stroke this annotation's lines in its own color
+                        try:
+                            shape.finish(color=pdf_color, width=0.5, closePath=False)
                         except Exception as e:
-                            print(f"Failed to add strikethrough: {e}")
-
-            elif isinstance(annotation, ImageAnnotation):
-                # Convert screen coordinates to PDF coordinates
-                pdf_x = annotation.x / (BASE_SCALE * zoom_at_creation)
-                pdf_y = annotation.y / (BASE_SCALE * zoom_at_creation)
-                pdf_width = annotation.width / (BASE_SCALE * zoom_at_creation)
-                pdf_height = annotation.height / (BASE_SCALE * zoom_at_creation)
-
-                # Define the rectangle where the image will be placed
-                rect = fitz.Rect(pdf_x, pdf_y, pdf_x + pdf_width, pdf_y + pdf_height)
-
-                # Insert the image
-                try:
-                    page.insert_image(rect, filename=annotation.image_path)
-                except Exception as e:
-                    print(f"Failed to insert image: {e}")
-
-            elif isinstance(annotation, DoodleAnnotation):
-                # Convert screen coordinates to PDF coordinates
-                pdf_x = annotation.x / (BASE_SCALE * zoom_at_creation)
-                pdf_y = annotation.y / (BASE_SCALE * zoom_at_creation)
-                pdf_width = annotation.width / (BASE_SCALE * zoom_at_creation)
-                pdf_height = annotation.height / (BASE_SCALE * zoom_at_creation)
-
-                # Define the rectangle where the doodle will be placed
-                rect = fitz.Rect(pdf_x, pdf_y, pdf_x + pdf_width, pdf_y + pdf_height)
-
-                # Save the doodle pixmap to a temporary file
-                try:
-                    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-                        temp_path = tmp_file.name
-                        annotation.pixmap.save(temp_path, 'PNG')
-
-                    # Insert the doodle image
-                    page.insert_image(rect, filename=temp_path)
-
-                    # Clean up temp file
-                    import os
-                    os.unlink(temp_path)
-                except Exception as e:
-                    print(f"Failed to insert doodle: {e}")
+                            print(f"Failed to add underline/strikethrough: {e}")
+
+                elif isinstance(annotation, ImageAnnotation):
+                    # Convert screen coordinates to PDF coordinates
+                    pdf_x = annotation.x / (BASE_SCALE * zoom_at_creation)
+                    pdf_y = annotation.y / (BASE_SCALE * zoom_at_creation)
+                    pdf_width = annotation.width / (BASE_SCALE * zoom_at_creation)
+                    pdf_height = annotation.height / (BASE_SCALE * zoom_at_creation)
+
+                    # Define the rectangle where the image will be placed
+                    rect = fitz.Rect(pdf_x, pdf_y, pdf_x + pdf_width, pdf_y + pdf_height)
+
+                    # Write queued text first so the image stacks above it, as in the preview
+                    shape.commit()
+
+                    # Insert the image
+                    try:
+                        page.insert_image(rect, filename=annotation.image_path)
+                    except Exception as e:
+                        print(f"Failed to insert image: {e}")
+
+                elif isinstance(annotation, DoodleAnnotation):
+                    # Convert screen coordinates to PDF coordinates
+                    pdf_x = annotation.x / (BASE_SCALE * zoom_at_creation)
+                    pdf_y = annotation.y / (BASE_SCALE * zoom_at_creation)
+                    pdf_width = annotation.width / (BASE_SCALE * zoom_at_creation)
+                    pdf_height = annotation.height / (BASE_SCALE * zoom_at_creation)
+
+                    # Define the rectangle where the doodle will be placed
+                    rect = fitz.Rect(pdf_x, pdf_y, pdf_x + pdf_width, pdf_y + pdf_height)
+
+                    # Save the doodle pixmap to a temporary file
+                    try:
+                        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
+                            temp_path = tmp_file.name
+                            annotation.pixmap.save(temp_path, 'PNG')
+
+                        # Write queued text first so the doodle stacks above it, as in the preview
+                        shape.commit()
+
+                        # Insert the doodle image
+                        page.insert_image(rect, filename=temp_path)
+
+                        # Clean up temp file
+                        import os
+                        os.unlink(temp_path)
+                    except Exception as e:
+                        print(f"Failed to insert doodle: {e}")
+
+            shape.commit()
@@ -3,37 +3,54 @@ PDF Editor - Main Application
 A simple PDF viewer and editor application built with PyQt5 and PyMuPDF.
 """
 
+import functools
+from collections import defaultdict
+import os
+import shutil
 import sys
+import tempfile
 from PyQt5.QtWidgets import (QApplication, QLabel, QMainWindow, QFileDialog,
                              QAction, QScrollArea, QPushButton,
                              QVBoxLayout, QHBoxLayout, QWidget, QDialog, QSlider,
                              QMessageBox)
-from PyQt5.QtGui import QFont, QKeySequence, QIcon
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont, QKeySequence, QIcon, QPixmapCache
+from PyQt5.QtCore import Qt, QTimer, QThreadPool
 
 from typing import Optional, List
 from PyQt5.QtCore import QPoint
 
 from core.enums import EditMode
-from core.constants import (BASE_SCALE, MIN_ZOOM, MAX_ZOOM, DEFAULT_ZOOM,
+from core.constants import (BASE_SCALE, PAGE_CACHE_LIMIT_KB, PREFETCH_DELAY_MS, MIN_ZOOM, MAX_ZOOM, DEFAULT_ZOOM,
                              ZOOM_SLIDER_MIN, ZOOM_SLIDER_MAX, ZOOM_SLIDER_DEFAULT,
-                             ZOOM_SLIDER_TICK_INTERVAL, ZOOM_SLIDER_WIDTH,
+                             ZOOM_SLIDER_TICK_INTERVAL, ZOOM_SLIDER_WIDTH, ZOOM_DEBOUNCE_MS,
                              WINDOW_MARGIN, DECORATION_HEIGHT, DECORATION_WIDTH,
                              MIN_BUTTON_HEIGHT, BUTTON_HEIGHT_PADDING,
-                             DEFAULT_MENUBAR_HEIGHT,
+                             DEFAULT_MENUBAR_HEIGHT, RESIZE_SKIP_THRESHOLD,
                              TEXT_MODE_CURSOR, IMAGE_MODE_CURSOR, DOODLE_MODE_CURSOR)
 from core.config import Config
 from ui.dialogs import TextFormatDialog, DoodleDialog, UserGuideDialog
 from ui import AllPagesWindow
 from ui.styles import TOOLBAR_STYLESHEET
-from models import TextAnnotation, ImageAnnotation, DoodleAnnotation, TextFormat, DrawingData
+from models import Annotation, TextAnnotation, ImageAnnotation, DoodleAnnotation, TextFormat, DrawingData
 from ui.widgets import PDFViewLabel
-from operations import PDFOperations, WindowManager
+from operations import PDFOperations, WindowManager, ImageLoadTask
+
+
+@functools.lru_cache(maxsize=None)
+def _themed_icon(name: str) -> QIcon:
+    """Look up a theme icon once and share it across editor windows"""
+    return QIcon.fromTheme(name, QIcon())
 
 
 class PDFEditor(QMainWindow, PDFOperations, WindowManager):
     """Main PDF Editor window"""
 
+    _MODE_CURSORS = {
+        EditMode.TEXT: TEXT_MODE_CURSOR,
+        EditMode.IMAGE: IMAGE_MODE_CURSOR,
+        EditMode.DOODLE: DOODLE_MODE_CURSOR,
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Amar PDF")
@@ -41,15 +58,56 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
 
         # Initialize state
         self.doc = None
+        self._doc_dirty_structural = False
+        # Bumped whenever a different file is opened or the pages are rearranged, so late
+        # async results can tell whether their page index still means the same page
+        self._doc_generation = 0
         self.current_page = 0
         self.draft_annotations = []
+        self.draft_annotations_by_page = defaultdict(list)
         self.zoom_level = DEFAULT_ZOOM
         self.current_mode = EditMode.TEXT  # Default mode
 
+        # Rendered pages are kept in Qt's pixmap cache, keyed per editor/page/zoom.
+        # Bumping the generation orphans every key of the previous document state;
+        # bumping a page's own generation orphans just that page's renders.
+        # Inserted keys are tracked per page so orphaned renders can be freed at once.
+        QPixmapCache.setCacheLimit(PAGE_CACHE_LIMIT_KB)
+        self._page_cache_generation = 0
+        self._page_generations = {}
+        self._page_cache_keys = defaultdict(set)
+
+        # Neighbouring pages are pre-rendered once the UI has been idle for a moment
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(PREFETCH_DELAY_MS)
+        self._prefetch_timer.timeout.connect(self._prefetch_neighbor_pages)
+
+        # While the zoom slider moves, the last full render is scaled as a preview;
+        # the real render happens once the slider has rested for ZOOM_DEBOUNCE_MS
+        self._base_pixmap = None
+        self._base_zoom = self.zoom_level
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(ZOOM_DEBOUNCE_MS)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+
+        # Heights of the window chrome around the page, measured once laid out
+        # and measured again when the window moves to another screen
+        self._chrome_heights = None
+        self._screen_tracked = False
+
+        # File dialogs are created once and reused; the PDF one is built up front
+        # so the first Open doesn't pay the dialog's construction cost
+        self._file_dialogs = {}
+        self._text_dialog = None
+        self._user_guide_dialog = None
+
         # Setup UI
         self._setup_ui()
         self._setup_menubar()
         self.toolbar = self._setup_toolbar()
+        self._get_file_dialog(Config.SUPPORTED_PDF_FORMATS)
 
     def _setup_ui(self):
         """Setup the user interface"""
@@ -177,13 +235,13 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         toolbar.setStyleSheet(TOOLBAR_STYLESHEET)
 
         # Save PDF button
-        save_pdf_action = QAction(QIcon.fromTheme("document-save", QIcon()), "💾", self)
+        save_pdf_action = QAction(_themed_icon("document-save"), "💾", self)
         save_pdf_action.setToolTip("Save PDF with annotations (Cmd+S / Ctrl+S)")
         save_pdf_action.triggered.connect(self.save_pdf)
         toolbar.addAction(save_pdf_action)
 
         # Merge PDF button
-        merge_pdf_action = QAction(QIcon.fromTheme("document-merge", QIcon()), "🔗", self)
+        merge_pdf_action = QAction(_themed_icon("document-merge"), "🔗", self)
         merge_pdf_action.setToolTip("Merge another PDF into this document")
         merge_pdf_action.triggered.connect(self.merge_pdf)
         toolbar.addAction(merge_pdf_action)
@@ -191,7 +249,7 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         toolbar.addSeparator()
 
         # Add Text button (checkable for mode selection)
-        self.add_text_action = QAction(QIcon.fromTheme("format-text", QIcon()), "T", self)
+        self.add_text_action = QAction(_themed_icon("format-text"), "T", self)
         self.add_text_action.setToolTip("Text Mode - Click to add text annotations")
         self.add_text_action.setCheckable(True)
         self.add_text_action.setChecked(True)  # Default mode
@@ -199,14 +257,14 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         toolbar.addAction(self.add_text_action)
 
         # Add Image button (checkable for mode selection)
-        self.add_image_action = QAction(QIcon.fromTheme("insert-image", QIcon()), "🖼️", self)
+        self.add_image_action = QAction(_themed_icon("insert-image"), "🖼️", self)
         self.add_image_action.setToolTip("Image Mode - Click to add images to PDF")
         self.add_image_action.setCheckable(True)
         self.add_image_action.triggered.connect(lambda: self.set_mode(EditMode.IMAGE))
         toolbar.addAction(self.add_image_action)
 
         # Add Doodle button (checkable for mode selection)
-        self.add_doodle_action = QAction(QIcon.fromTheme("draw-freehand", QIcon()), "✎", self)
+        self.add_doodle_action = QAction(_themed_icon("draw-freehand"), "✎", self)
         self.add_doodle_action.setToolTip("Doodle Mode - Click to draw on PDF")
         self.add_doodle_action.setCheckable(True)
         self.add_doodle_action.triggered.connect(lambda: self.set_mode(EditMode.DOODLE))
@@ -215,7 +273,7 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         toolbar.addSeparator()
 
         # User Guide button
-        user_guide_action = QAction(QIcon.fromTheme("help-contents", QIcon()), "?", self)
+        user_guide_action = QAction(_themed_icon("help-contents"), "?", self)
         user_guide_action.setToolTip("User Guide")
         user_guide_action.triggered.connect(self.show_user_guide)
         toolbar.addAction(user_guide_action)
@@ -228,43 +286,128 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
 
         Updates button states and cursor to match the selected mode.
         """
-        self.current_mode = mode
-
-        # Update button states - only one should be checked
+        # Update button states - only one should be checked. Done even when the
+        # mode is unchanged, since clicking the active button unchecks it.
         self.add_text_action.setChecked(mode == EditMode.TEXT)
         self.add_image_action.setChecked(mode == EditMode.IMAGE)
         self.add_doodle_action.setChecked(mode == EditMode.DOODLE)
 
+        if mode == self.current_mode:
+            return
+
+        self.current_mode = mode
+
         # Update label's current mode for cursor changes
         self.label.current_mode = mode
 
         # Update cursor based on mode
-        if mode == EditMode.TEXT:
-            self.label.setCursor(TEXT_MODE_CURSOR)
-        elif mode == EditMode.IMAGE:
-            self.label.setCursor(IMAGE_MODE_CURSOR)
-        elif mode == EditMode.DOODLE:
-            self.label.setCursor(DOODLE_MODE_CURSOR)
+        self.label.setCursor(self._MODE_CURSORS[mode])
 
     # PDF Operations
     def open_pdf(self):
         """Open a PDF file"""
-        path, _ = QFileDialog.getOpenFileName(self, "Open PDF", "", Config.SUPPORTED_PDF_FORMATS)
+        path = self._ask_file_path("Open PDF", Config.SUPPORTED_PDF_FORMATS)
         if not path:
             return
 
-        self.doc = self.open_pdf_file(path)
-        self.current_page = 0
-        self.draft_annotations = []
+        # Opening only parses the xref; pages are loaded on demand by show_page.
+        # The parse and first render still block on large files, so show a busy cursor.
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            old_doc = self.doc
+            self.doc = self.open_pdf_file(path)
+            if old_doc is not None:
+                # Release the previous document and the resources MuPDF cached for it
+                old_doc.close()
+                self.trim_render_store()
+            self._invalidate_page_cache()
+            self._doc_dirty_structural = False
+            self._doc_generation += 1
+            self.current_page = 0
+            self.draft_annotations = []
+            self.draft_annotations_by_page.clear()
+
+            # Switch from welcome message to PDF label
+            old_widget = self.scroll_area.takeWidget()
+            self.scroll_area.setWidget(self.label)
+            self.scroll_area.setWidgetResizable(False)
 
-        # Switch from welcome message to PDF label
-        old_widget = self.scroll_area.takeWidget()
-        self.scroll_area.setWidget(self.label)
-        self.scroll_area.setWidgetResizable(False)
+            self.show_page(self.current_page)
+        finally:
+            QApplication.restoreOverrideCursor()
 
-        self.show_page(self.current_page)
         self.update_buttons()
-        self.resize_window_to_pdf()
+        self._initial_fit_to_pdf()
+
+    def replace_document(self, new_doc) -> None:
+        """
+        Swap in a restructured copy of the open document (e.g. reordered pages).
+
+        The old document is closed and every cached render is dropped. The next
+        save to the original file is a full rewrite, since the new document
+        isn't backed by that file. Image loads still in flight are dropped, as
+        their page index may no longer name the same page.
+
+        Args:
+            new_doc: fitz.Document that replaces self.doc
+        """
+        self.doc.close()
+        self.doc = new_doc
+        self._doc_dirty_structural = True
+        self._doc_generation += 1
+        # The new document may reuse the old one's id(), so cached renders
+        # of the old page order must not be mistaken for the new pages
+        self._invalidate_page_cache()
+        self.current_page = 0
+        self.show_page(0)
+        self.update_buttons()
+
+    def _get_file_dialog(self, file_filter: str, save: bool = False) -> QFileDialog:
+        """
+        Get the reusable file dialog for a file filter and direction.
+
+        Args:
+            file_filter: Name filter, e.g. Config.SUPPORTED_PDF_FORMATS
+            save: True for a save dialog, False for an open dialog
+
+        Returns:
+            QFileDialog instance, created on first use
+        """
+        key = (file_filter, save)
+        dialog = self._file_dialogs.get(key)
+        if dialog is None:
+            dialog = QFileDialog(self, "", "", file_filter)
+            if save:
+                dialog.setAcceptMode(QFileDialog.AcceptSave)
+                dialog.setFileMode(QFileDialog.AnyFile)
+            else:
+                dialog.setFileMode(QFileDialog.ExistingFile)
+            self._file_dialogs[key] = dialog
+        return dialog
+
+    def _ask_file_path(self, caption: str, file_filter: str, save: bool = False,
+                       default_name: str = "") -> str:
+        """
+        Ask the user for a file path using a reused file dialog.
+
+        Args:
+            caption: Dialog window title
+            file_filter: Name filter, e.g. Config.SUPPORTED_PDF_FORMATS
+            save: True to ask for a file to save to
+            default_name: File name preselected in the dialog
+
+        Returns:
+            Selected path, or an empty string if the dialog was cancelled
+        """
+        dialog = self._get_file_dialog(file_filter, save)
+        dialog.setWindowTitle(caption)
+        if default_name:
+            dialog.selectFile(default_name)
+
+        if dialog.exec_() != QDialog.Accepted:
+            return ""
+        files = dialog.selectedFiles()
+        return files[0] if files else ""
 
     def show_page(self, page_num: int) -> None:
         """
@@ -276,23 +419,97 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         Args:
             page_num: Zero-indexed page number to display
         """
-        page = self.doc[page_num]
-
-        # Render page at current zoom
-        zoom_factor = BASE_SCALE * self.zoom_level
-        pixmap = self.render_page(page, zoom_factor)
+        pixmap = self._get_page_pixmap(page_num)
+        self._base_pixmap = pixmap
+        self._base_zoom = self.zoom_level
 
         self.label.setPixmap(pixmap)
         self.label.adjustSize()
 
         # Update annotations for current page
-        self.label.annotations = [a for a in self.draft_annotations if a.page_num == page_num]
+        # The label shares the page's bucket, so additions and deletions stay in sync
+        self.label.annotations = self.draft_annotations_by_page[page_num]
         self.label.zoom_level = self.zoom_level
-        self.label.update()
+        self.label.invalidate_geometry()
+        self.label.request_update()
 
         # Update page counter label
         self.page_label.setText(f"Page {page_num + 1}/{len(self.doc)}")
 
+        # Warm the cache for prev/next while the user reads this page
+        self._prefetch_timer.start()
+
+    def _get_page_pixmap(self, page_num: int):
+        """
+        Get the rendered page at the current zoom, rendering it on a cache miss.
+
+        Args:
+            page_num: Zero-indexed page number
+
+        Returns:
+            QPixmap of the page
+        """
+        # Reuse the rendered page if this page was already shown at this zoom
+        cache_key = self._page_cache_key(page_num)
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None or pixmap.isNull():
+            # Render page at current zoom, in device pixels so HiDPI screens
+            # show it sharp; the label still lays it out at BASE_SCALE * zoom
+            page = self.doc[page_num]
+            dpr = self.devicePixelRatioF()
+            zoom_factor = BASE_SCALE * self.zoom_level * dpr
+            pixmap = self.render_page(page, zoom_factor)
+            pixmap.setDevicePixelRatio(dpr)
+            QPixmapCache.insert(cache_key, pixmap)
+            self._page_cache_keys[page_num].add(cache_key)
+        return pixmap
+
+    def _prefetch_neighbor_pages(self) -> None:
+        """
+        Render the pages next to the current one into the page cache.
+
+        PyMuPDF can't be used from worker threads, so this runs on the GUI
+        thread while it is idle, one page per timer slot so user input is
+        never held up by more than a single render.
+        """
+        # Don't pre-render at a zoom the slider is still moving through
+        if not self.doc or self._zoom_timer.isActive():
+            return
+
+        for page_num in (self.current_page + 1, self.current_page - 1):
+            if 0 <= page_num < len(self.doc):
+                pixmap = QPixmapCache.find(self._page_cache_key(page_num))
+                if pixmap is None or pixmap.isNull():
+                    self._get_page_pixmap(page_num)
+                    self._prefetch_timer.start()
+                    return
+
+    def _page_cache_key(self, page_num: int) -> str:
+        """Build the QPixmapCache key for a page of the current document at the current zoom"""
+        page_generation = self._page_generations.get(page_num, 0)
+        return (f"{id(self)}:{self._page_cache_generation}:{page_num}.{page_generation}:"
+                f"{self.zoom_level:.3f}@{self.devicePixelRatioF():g}")
+
+    def _invalidate_page_cache(self, pages=None) -> None:
+        """
+        Make cached page renders unreachable and free them from Qt's cache.
+
+        Args:
+            pages: Page numbers whose content changed, or None when the
+                document itself was replaced or its pages were rearranged
+        """
+        if pages is None:
+            self._page_cache_generation += 1
+            self._page_generations.clear()
+            pages = list(self._page_cache_keys)
+        else:
+            for page_num in pages:
+                self._page_generations[page_num] = self._page_generations.get(page_num, 0) + 1
+
+        for page_num in pages:
+            for cache_key in self._page_cache_keys.pop(page_num, ()):
+                QPixmapCache.remove(cache_key)
+
     def save_pdf(self):
         """
         Save the PDF file with any modifications.
@@ -306,32 +523,38 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         if not self.doc:
             return
 
-        path, _ = QFileDialog.getSaveFileName(self, "Save PDF", Config.DEFAULT_SAVE_FILENAME, Config.SUPPORTED_PDF_FORMATS)
+        path = self._ask_file_path("Save PDF", Config.SUPPORTED_PDF_FORMATS, save=True,
+                                   default_name=Config.DEFAULT_SAVE_FILENAME)
         if not path:
             return
 
-        # Store current file path to check if saving to same file
-        current_file = self.doc.name if hasattr(self.doc, 'name') else None
-        is_same_file = current_file and current_file == path
+        # MuPDF refuses a full rewrite onto the file backing the open document
+        is_same_file = bool(self.doc.name) and os.path.abspath(self.doc.name) == os.path.abspath(path)
+
+        # Only pages that receive annotations change; other cached renders stay valid
+        annotated_pages = {annotation.page_num for annotation in self.draft_annotations}
 
         # Apply annotations to PDF (if any exist)
         if self.draft_annotations:
             self.save_pdf_with_annotations(self.doc, self.draft_annotations)
 
         # Save document
-        if is_same_file:
+        if is_same_file and not self._doc_dirty_structural and self.doc.can_save_incrementally():
+            # Only annotations changed - append an incremental update and keep the open handle
+            try:
+                self.doc.saveIncr()
+            except Exception as e:
+                QMessageBox.critical(self, "Save Error", f"Failed to save PDF: {str(e)}")
+                return
+        elif is_same_file:
             # Saving to the same file that's currently open
             # Need to use a temporary file to avoid "save to original must be incremental" error
-            import tempfile
-            import shutil
-
-            # Create temporary file
             with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
                 temp_path = tmp_file.name
 
             try:
                 # Save to temporary file
-                self.doc.save(temp_path)
+                self.doc.save(temp_path, garbage=4, deflate=True)
 
                 # Close the current document
                 self.doc.close()
@@ -341,23 +564,29 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
 
                 # Reopen the saved file
                 self.doc = self.open_pdf_file(path)
+                self._doc_dirty_structural = False
             except Exception as e:
                 # If anything fails, try to clean up temp file
-                import os
                 if os.path.exists(temp_path):
                     os.unlink(temp_path)
                 QMessageBox.critical(self, "Save Error", f"Failed to save PDF: {str(e)}")
                 return
         else:
-            # Saving to a different file - direct save works fine
-            self.doc.save(path)
-            # Close old document and open the new one
-            self.doc.close()
-            self.doc = self.open_pdf_file(path)
+            # Saving to a different file - the open document stays valid, no need to re-parse it.
+            # garbage>=2 compacts and renumbers objects inside the live document, so a later
+            # incremental save to its original file would write an inconsistent xref; level 1
+            # only drops unused objects and leaves the numbering alone.
+            self.doc.save(path, garbage=1, deflate=True)
+
+        self.trim_render_store()
+
+        # Annotations are now part of the page content - those pages' renders are stale.
+        # A reopen after a full rewrite keeps the same pages, so nothing else is dropped.
+        self._invalidate_page_cache(annotated_pages)
 
         # Clear draft annotations and reload page
         self.draft_annotations = []
-        self.label.annotations = []
+        self.draft_annotations_by_page.clear()
         self.show_page(self.current_page)
 
     def merge_pdf(self) -> None:
@@ -379,12 +608,7 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
             return
 
         # Open file dialog to select PDF to merge
-        path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select PDF to Merge",
-            "",
-            Config.SUPPORTED_PDF_FORMATS
-        )
+        path = self._ask_file_path("Select PDF to Merge", Config.SUPPORTED_PDF_FORMATS)
         if not path:
             return
 
@@ -397,9 +621,12 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
 
             # Insert all pages from the merge document
             self.doc.insert_pdf(merge_doc)
+            self._doc_dirty_structural = True
 
             # Close the merge document
             merge_doc.close()
+            self.trim_render_store()
+            self._invalidate_page_cache()
 
             # Update navigation buttons
             self.update_buttons()
@@ -459,30 +686,128 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         self.zoom_level = value / 100.0
         self.zoom_label.setText(f"{value}%")
 
+        if not self.doc:
+            return
+
+        if self._base_pixmap is None or self._base_pixmap.isNull():
+            self._zoom_timer.start()
+            return
+
+        scale = self.zoom_level / self._base_zoom
+        width = round(self._base_pixmap.width() * scale)
+        height = round(self._base_pixmap.height() * scale)
+
+        if width == self._base_pixmap.width() and height == self._base_pixmap.height():
+            # The page comes out at the same pixel size - keep the sharp render as is
+            self._zoom_timer.stop()
+            pixmap = self._base_pixmap
+        else:
+            # Show a cheap scaled preview of the last full render right away and
+            # re-render properly once the slider stops moving
+            pixmap = self._base_pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.FastTransformation)
+            pixmap.setDevicePixelRatio(self._base_pixmap.devicePixelRatio())
+            self._zoom_timer.start()
+
+        self.label.setPixmap(pixmap)
+        self.label.adjustSize()
+        self.label.zoom_level = self.zoom_level
+        self.label.invalidate_geometry()
+        self.label.request_update()
+
+    def _apply_zoom(self) -> None:
+        """Render the current page at the final zoom level after slider movement settles"""
         if self.doc:
             self.show_page(self.current_page)
-            self.resize_window_to_pdf()
+            self._refit_on_zoom()
+
+    def _fit_window_size(self):
+        """
+        Get the window size that fits the current page within screen bounds.
 
-    def resize_window_to_pdf(self):
-        """Resize window to fit PDF dimensions within screen bounds"""
+        Returns:
+            Tuple of (width, height) for the window
+        """
+        # Window geometry is in logical pixels; the page may be rendered at a higher DPR
+        pixmap = self.label.pixmap()
+        pdf_width = pixmap.width() / pixmap.devicePixelRatio()
+        pdf_height = pixmap.height() / pixmap.devicePixelRatio()
+
+        bars_height, button_height = self._get_chrome_heights()
+
+        # Calculate optimal size using WindowManager mixin
+        return self.calculate_window_size(
+            pdf_width, pdf_height, bars_height, button_height
+        )
+
+    def _initial_fit_to_pdf(self) -> None:
+        """Resize window to fit the newly opened PDF and center it on screen"""
+        if not self.doc:
+            return
+
+        width, height = self._fit_window_size()
+
+        # Skip tiny size changes - each resize is a full relayout plus a window-manager round-trip
+        if (abs(width - self.width()) >= RESIZE_SKIP_THRESHOLD
+                or abs(height - self.height()) >= RESIZE_SKIP_THRESHOLD):
+            self.resize(width, height)
+
+        self.center_window(self)
+
+    def _refit_on_zoom(self) -> None:
+        """
+        Shrink the window if it is now larger than the zoomed page needs.
+
+        Zooming in only changes the pixmap inside the scroll area, so the
+        window is never grown or moved here.
+        """
         if not self.doc:
             return
 
-        pdf_width = self.label.pixmap().width()
-        pdf_height = self.label.pixmap().height()
+        max_width, max_height = self._fit_window_size()
+        width = min(self.width(), max_width)
+        height = min(self.height(), max_height)
 
+        if (self.width() - width >= RESIZE_SKIP_THRESHOLD
+                or self.height() - height >= RESIZE_SKIP_THRESHOLD):
+            self.resize(width, height)
+
+    def _get_chrome_heights(self):
+        """
+        Get the heights of the window chrome above and below the page.
+
+        The values are measured once the menu bar and toolbar have been laid
+        out and reused afterwards; until then the defaults are returned.
+
+        Returns:
+            Tuple of (menu bar + toolbar height, navigation row height)
+        """
+        if self._chrome_heights is not None:
+            return self._chrome_heights
+
+        laid_out = self.menuBar().height() > 0 and self.toolbar.height() > 0
         menubar_height = self.menuBar().height() if self.menuBar().height() > 0 else DEFAULT_MENUBAR_HEIGHT
         toolbar_height = self.toolbar.height() if self.toolbar.height() > 0 else DECORATION_HEIGHT
         self.prev_button.adjustSize()
         button_height = max(self.prev_button.height(), MIN_BUTTON_HEIGHT) + BUTTON_HEIGHT_PADDING
 
-        # Calculate optimal size using WindowManager mixin
-        width, height = self.calculate_window_size(
-            pdf_width, pdf_height, menubar_height + toolbar_height, button_height
-        )
-
-        self.resize(width, height)
-        self.center_window(self)
+        heights = (menubar_height + toolbar_height, button_height)
+        if laid_out:
+            self._chrome_heights = heights
+        return heights
+
+    def showEvent(self, event):
+        """Start following screen changes once the window has a native handle"""
+        super().showEvent(event)
+        if not self._screen_tracked and self.windowHandle() is not None:
+            self.windowHandle().screenChanged.connect(self._on_screen_changed)
+            self._screen_tracked = True
+
+    def _on_screen_changed(self, screen) -> None:
+        """Re-measure the chrome and re-render the page for the new screen's scale"""
+        self._chrome_heights = None
+        if self.doc:
+            # The page cache key includes the DPR, so this renders at the new ratio
+            self.show_page(self.current_page)
 
     # Annotation Operations
     def mousePressEvent(self, event):
@@ -514,10 +839,7 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         Returns:
             True if clicking on an existing annotation, False otherwise
         """
-        return any(
-            annotation.contains_point(label_pos.x(), label_pos.y(), self.zoom_level)
-            for annotation in self.label.annotations
-        )
+        return self.label.annotation_at(label_pos.x(), label_pos.y()) is not None
 
     def _handle_text_mode_click(self, label_pos: QPoint) -> None:
         """
@@ -530,8 +852,11 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         if self._is_clicking_annotation(label_pos):
             return
 
-        # Add new text annotation
-        dialog = TextFormatDialog(self)
+        # Add new text annotation, reusing the dialog (and its last style) between clicks
+        if self._text_dialog is None:
+            self._text_dialog = TextFormatDialog(self)
+        dialog = self._text_dialog
+        dialog.reset()
         if dialog.exec_() == QDialog.Accepted:
             text_format = dialog.get_values()
             self.add_draft_text(label_pos.x(), label_pos.y(), text_format)
@@ -548,12 +873,7 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
             return
 
         # Open file dialog to select image
-        image_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select Image",
-            "",
-            Config.SUPPORTED_IMAGE_FORMATS
-        )
+        image_path = self._ask_file_path("Select Image", Config.SUPPORTED_IMAGE_FORMATS)
 
         if image_path:
             self.add_draft_image(label_pos.x(), label_pos.y(), image_path)
@@ -576,6 +896,40 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
             if drawing_data:
                 self.add_draft_doodle(label_pos.x(), label_pos.y(), drawing_data)
 
+    def add_draft_annotations(self, annotations: List[Annotation]) -> None:
+        """
+        Add several annotations in draft mode with a single repaint.
+
+        Args:
+            annotations: Annotations to add; those on the current page are
+                displayed immediately
+        """
+        self.draft_annotations.extend(annotations)
+        for annotation in annotations:
+            self.draft_annotations_by_page[annotation.page_num].append(annotation)
+            # Only the area of annotations on the displayed page needs repainting
+            if annotation.page_num == self.current_page:
+                self.label.request_update(self.label.annotation_repaint_rect(annotation))
+
+    def remove_draft_annotation(self, annotation: Annotation) -> None:
+        """
+        Remove a draft annotation from the flat list and its page bucket.
+
+        Args:
+            annotation: Annotation to remove
+        """
+        if annotation in self.draft_annotations:
+            self.draft_annotations.remove(annotation)
+        bucket = self.draft_annotations_by_page.get(annotation.page_num)
+        if bucket and annotation in bucket:
+            bucket.remove(annotation)
+
+    def reindex_draft_annotations(self) -> None:
+        """Rebuild the per-page buckets after draft_annotations was replaced or renumbered"""
+        self.draft_annotations_by_page.clear()
+        for annotation in self.draft_annotations:
+            self.draft_annotations_by_page[annotation.page_num].append(annotation)
+
     def add_draft_text(self, x: float, y: float, text_format: TextFormat) -> None:
         """
         Add text annotation in draft mode.
@@ -592,18 +946,39 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         annotation = TextAnnotation.from_text_format(x, y, self.current_page, text_format)
         annotation.created_at_zoom = self.zoom_level
 
-        self.draft_annotations.append(annotation)
-        self.label.annotations.append(annotation)
-        self.label.update()
+        self.add_draft_annotations([annotation])
 
     def add_draft_image(self, x, y, image_path):
-        """Add image annotation in draft mode"""
-        annotation = ImageAnnotation(x, y, image_path, self.current_page)
-        annotation.created_at_zoom = self.zoom_level
+        """
+        Add image annotation in draft mode.
+
+        The image is decoded on a worker thread; the annotation is added
+        when decoding finishes, so large photos don't freeze the window.
+        """
+        task = ImageLoadTask(image_path, (self._doc_generation, self.current_page, self.zoom_level, x, y))
+        task.signals.loaded.connect(self._on_draft_image_loaded)
+        task.signals.failed.connect(self._on_draft_image_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_draft_image_loaded(self, context, image_path, image):
+        """Create the image annotation once its file has been decoded"""
+        generation, page_num, zoom_level, x, y = context
+        if generation != self._doc_generation:
+            # The page index may now point at a different page (or none at all)
+            QMessageBox.information(
+                self, "Image Not Added",
+                "The image was not added because another PDF was opened or the pages "
+                f"were reordered or deleted while it was loading:\n{image_path}")
+            return
+
+        annotation = ImageAnnotation(x, y, image_path, page_num, image=image)
+        annotation.created_at_zoom = zoom_level
+
+        self.add_draft_annotations([annotation])
 
-        self.draft_annotations.append(annotation)
-        self.label.annotations.append(annotation)
-        self.label.update()
+    def _on_draft_image_failed(self, context, image_path, error):
+        """Report an image that could not be decoded"""
+        QMessageBox.warning(self, "Image Error", f"Failed to load image:\n{image_path}\n\n{error}")
 
     def add_draft_doodle(self, x: float, y: float, drawing_data: DrawingData) -> None:
         """
@@ -621,9 +996,7 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
         annotation = DoodleAnnotation(x, y, self.current_page, drawing_data)
         annotation.created_at_zoom = self.zoom_level
 
-        self.draft_annotations.append(annotation)
-        self.label.annotations.append(annotation)
-        self.label.update()
+        self.add_draft_annotations([annotation])
 
     def show_all_pages(self):
         """Open a new window showing all pages of the PDF"""
@@ -636,5 +1009,7 @@ class PDFEditor(QMainWindow, PDFOperations, WindowManager):
 
     def show_user_guide(self):
         """Show the user guide dialog"""
-        guide_dialog = UserGuideDialog(self)
-        guide_dialog.exec_()
+        # Build the guide once; later opens reuse the already laid-out document
+        if self._user_guide_dialog is None:
+            self._user_guide_dialog = UserGuideDialog(self)
+        self._user_guide_dialog.exec_()
@@ -15,16 +15,17 @@ echo "Creating iconset directory..."
 mkdir -p icon.iconset
 
 echo "Generating all required sizes..."
-sips -z 16 16     icon.png --out icon.iconset/icon_16x16.png
-sips -z 32 32     icon.png --out icon.iconset/icon_16x16@2x.png
-sips -z 32 32     icon.png --out icon.iconset/icon_32x32.png
-sips -z 64 64     icon.png --out icon.iconset/icon_32x32@2x.png
-sips -z 128 128   icon.png --out icon.iconset/icon_128x128.png
-sips -z 256 256   icon.png --out icon.iconset/icon_128x128@2x.png
-sips -z 256 256   icon.png --out icon.iconset/icon_256x256.png
-sips -z 512 512   icon.png --out icon.iconset/icon_256x256@2x.png
-sips -z 512 512   icon.png --out icon.iconset/icon_512x512.png
+# Each size is halved from the one just written; sizes needed twice are copied
 sips -z 1024 1024 icon.png --out icon.iconset/icon_512x512@2x.png
+sips -z 512 512   icon.png --out icon.iconset/icon_512x512.png
+cp icon.iconset/icon_512x512.png icon.iconset/icon_256x256@2x.png
+sips -z 256 256   icon.iconset/icon_512x512.png --out icon.iconset/icon_256x256.png
+cp icon.iconset/icon_256x256.png icon.iconset/icon_128x128@2x.png
+sips -z 128 128   icon.iconset/icon_256x256.png --out icon.iconset/icon_128x128.png
+sips -z 64 64     icon.iconset/icon_128x128.png --out icon.iconset/icon_32x32@2x.png
+sips -z 32 32     icon.iconset/icon_32x32@2x.png --out icon.iconset/icon_32x32.png
+cp icon.iconset/icon_32x32.png icon.iconset/icon_16x16@2x.png
+sips -z 16 16     icon.iconset/icon_32x32.png --out icon.iconset/icon_16x16.png
 
 echo "Converting to ICNS..."
 iconutil -c icns icon.iconset
@@ -55,25 +55,36 @@ def create_icons(base_image_path="icon_base.png"):
         print(f"Base image size: {img.size}")
 
         # Create Linux PNG (512x512)
+        # reducing_gap lets Pillow box-reduce a large source before the Lanczos pass
         print("\n1. Creating icon.png (Linux)...")
-        linux_icon = img.resize((512, 512), Image.Resampling.LANCZOS)
+        linux_icon = img.resize((512, 512), Image.Resampling.LANCZOS, reducing_gap=3.0)
         linux_icon.save('icon.png', 'PNG')
         print("   ✓ icon.png created (512x512)")
 
         # Create Windows ICO (multi-size)
         print("\n2. Creating icon.ico (Windows)...")
         sizes = [(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-        ico_images = []
 
-        for size in sizes:
-            ico_img = img.resize(size, Image.Resampling.LANCZOS)
-            ico_images.append(ico_img)
-
-        # Save as ICO with multiple sizes
-        ico_images[0].save(
+        # Each size is downsampled from the next larger one instead of from the
+        # full base image, so the small sizes don't filter millions of pixels
+        scaled = {(512, 512): linux_icon}
+        previous = linux_icon
+        for size in sorted(sizes, reverse=True):
+            # At 32px and below the result is dominated by how edges land on the
+            # pixel grid, not by the kernel, so a cheap box filter is enough
+            resample = Image.Resampling.LANCZOS if size[0] > 32 else Image.Resampling.BOX
+            previous = previous.resize(size, resample)
+            scaled[size] = previous
+
+        # Save every size in a single ICO call. The encoder only writes sizes up
+        # to the saved image's own, so save from the largest and hand it the
+        # pre-scaled images to use instead of resampling each one again
+        largest = max(sizes)
+        scaled[largest].save(
             'icon.ico',
             format='ICO',
-            sizes=[(img.width, img.height) for img in ico_images]
+            sizes=sizes,
+            append_images=[scaled[size] for size in sizes if size != largest]
         )
         print(f"   ✓ icon.ico created (multi-size: {', '.join(f'{s[0]}x{s[1]}' for s in sizes)})")
 
@@ -126,16 +137,17 @@ echo "Creating iconset directory..."
 mkdir -p icon.iconset
 
 echo "Generating all required sizes..."
-sips -z 16 16     icon.png --out icon.iconset/icon_16x16.png
-sips -z 32 32     icon.png --out icon.iconset/icon_16x16@2x.png
-sips -z 32 32     icon.png --out icon.iconset/icon_32x32.png
-sips -z 64 64     icon.png --out icon.iconset/icon_32x32@2x.png
-sips -z 128 128   icon.png --out icon.iconset/icon_128x128.png
-sips -z 256 256   icon.png --out icon.iconset/icon_128x128@2x.png
-sips -z 256 256   icon.png --out icon.iconset/icon_256x256.png
-sips -z 512 512   icon.png --out icon.iconset/icon_256x256@2x.png
-sips -z 512 512   icon.png --out icon.iconset/icon_512x512.png
+# Each size is halved from the one just written; sizes needed twice are copied
 sips -z 1024 1024 icon.png --out icon.iconset/icon_512x512@2x.png
+sips -z 512 512   icon.png --out icon.iconset/icon_512x512.png
+cp icon.iconset/icon_512x512.png icon.iconset/icon_256x256@2x.png
+sips -z 256 256   icon.iconset/icon_512x512.png --out icon.iconset/icon_256x256.png
+cp icon.iconset/icon_256x256.png icon.iconset/icon_128x128@2x.png
+sips -z 128 128   icon.iconset/icon_256x256.png --out icon.iconset/icon_128x128.png
+sips -z 64 64     icon.iconset/icon_128x128.png --out icon.iconset/icon_32x32@2x.png
+sips -z 32 32     icon.iconset/icon_32x32@2x.png --out icon.iconset/icon_32x32.png
+cp icon.iconset/icon_32x32.png icon.iconset/icon_16x16@2x.png
+sips -z 16 16     icon.iconset/icon_32x32.png --out icon.iconset/icon_16x16.png
 
 echo "Converting to ICNS..."
 iconutil -c icns icon.iconset
@@ -10,7 +10,7 @@ Requirements:
 """
 
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    from PIL import Image, ImageDraw
 except ImportError:
     print("ERROR: Pillow is required. Install with: pip install Pillow")
     exit(1)
@@ -2,13 +2,16 @@
 Doodle/drawing dialog
 """
 
+from array import array
+
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QLabel, QHBoxLayout,
                              QPushButton, QColorDialog, QSpinBox, QDialogButtonBox)
 from PyQt5.QtGui import QPainter, QPen, QPixmap
-from PyQt5.QtCore import Qt, QPoint
+from PyQt5.QtCore import Qt, QRect
 
 from core.constants import (CANVAS_WIDTH, CANVAS_HEIGHT, DEFAULT_PEN_WIDTH,
-                             MIN_PEN_WIDTH, MAX_PEN_WIDTH)
+                             MIN_PEN_WIDTH, MAX_PEN_WIDTH, DOODLE_UNDO_LIMIT,
+                             STROKE_SIMPLIFY_EPSILON, STROKE_SIMPLIFY_MIN_POINTS)
 from models import DrawingData, Stroke
 
 
@@ -25,14 +28,22 @@ class DrawingCanvas(QLabel):
         self.setStyleSheet("background-color: white; border: 1px solid gray;")
 
         self.drawing = False
-        self.current_stroke = []
+        self.current_stroke = array('h')  # x0, y0, x1, y1, ... of the stroke in progress (int16)
         self.drawing_data = DrawingData()  # Type-safe drawing data
         self.current_pen = QPen(Qt.black, DEFAULT_PEN_WIDTH, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
 
-        # Create canvas pixmap
+        # Create canvas pixmap. It is painted by paintEvent rather than handed to
+        # setPixmap(), so a new line segment only repaints the area it covers.
         self.canvas = QPixmap(self.size())
         self.canvas.fill(Qt.white)
-        self.setPixmap(self.canvas)
+
+        # Painter on the canvas for the stroke in progress, open from press to release
+        self._stroke_painter = None
+
+        # Canvas after each finished stroke, oldest first. QPixmap is implicitly
+        # shared, so a snapshot costs nothing until the next stroke is painted,
+        # and undo restores a snapshot instead of replaying every stroke.
+        self._history = [QPixmap(self.canvas)]
 
     def set_pen_color(self, color):
         """Set the drawing pen color"""
@@ -44,45 +55,88 @@ class DrawingCanvas(QLabel):
 
     def clear_canvas(self):
         """Clear the entire canvas"""
+        self._end_stroke_painter()
         self.drawing_data.clear()
         self.canvas.fill(Qt.white)
-        self.setPixmap(self.canvas)
+        self._history = [QPixmap(self.canvas)]
+        self.update()
+
+    def undo(self):
+        """Remove the last stroke by restoring the canvas from before it"""
+        self._end_stroke_painter()
+        if len(self._history) < 2 or not self.drawing_data.strokes:
+            return
+
+        self._history.pop()
+        self.canvas = QPixmap(self._history[-1])
+        self.drawing_data.remove_last_stroke()
+        self.update()
+
+    def paintEvent(self, event):
+        """Draw the background and border, then the exposed part of the canvas"""
+        super().paintEvent(event)
+
+        painter = QPainter(self)
+        painter.setClipRect(self.contentsRect() & event.rect())
+        painter.drawPixmap(0, 0, self.canvas)
+        painter.end()
 
     def mousePressEvent(self, event):
         """Start drawing a new stroke"""
         if event.button() == Qt.LeftButton:
             self.drawing = True
-            self.current_stroke = [event.pos()]
+            self.current_stroke = array('h', (event.x(), event.y()))
+
+            # Set up antialiasing and the pen once for the whole stroke
+            self._end_stroke_painter()
+            self._stroke_painter = QPainter(self.canvas)
+            self._stroke_painter.setRenderHint(QPainter.Antialiasing)
+            self._stroke_painter.setPen(self.current_pen)
+            if self.current_pen.color().alpha() == 255:
+                # An opaque pen on the opaque canvas needs no alpha blending
+                self._stroke_painter.setCompositionMode(QPainter.CompositionMode_Source)
 
     def mouseMoveEvent(self, event):
         """Continue drawing the current stroke"""
-        if self.drawing and event.buttons() & Qt.LeftButton:
-            self.current_stroke.append(event.pos())
-
-            # Draw on canvas
-            painter = QPainter(self.canvas)
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setPen(self.current_pen)
+        if self.drawing and event.buttons() & Qt.LeftButton and self._stroke_painter is not None:
+            x0, y0 = self.current_stroke[-2], self.current_stroke[-1]
+            x1, y1 = event.x(), event.y()
+            self.current_stroke.extend((x1, y1))
 
-            if len(self.current_stroke) >= 2:
-                painter.drawLine(self.current_stroke[-2], self.current_stroke[-1])
+            # Draw the new segment on the canvas
+            self._stroke_painter.drawLine(x0, y0, x1, y1)
 
-            painter.end()
-            self.setPixmap(self.canvas)
+            # Repaint only the segment's bounds, grown by the pen's half width
+            margin = self.current_pen.width() // 2 + 2
+            self.update(QRect(min(x0, x1) - margin, min(y0, y1) - margin,
+                              abs(x1 - x0) + 1 + 2 * margin, abs(y1 - y0) + 1 + 2 * margin))
 
     def mouseReleaseEvent(self, event):
         """Finish the current stroke and save it"""
         if event.button() == Qt.LeftButton and self.drawing:
             self.drawing = False
+            self._end_stroke_painter()
             if self.current_stroke:
                 # Create a Stroke object from the current stroke
-                stroke = Stroke.from_qpoints(
-                    qpoints=self.current_stroke.copy(),
+                stroke = Stroke.from_flat_coords(
+                    coords=self.current_stroke,
                     qcolor=self.current_pen.color(),
                     width=self.current_pen.width()
                 )
+                if len(stroke.points) > STROKE_SIMPLIFY_MIN_POINTS:
+                    stroke.simplify(STROKE_SIMPLIFY_EPSILON)
                 self.drawing_data.add_stroke(stroke)
-                self.current_stroke = []
+                self.current_stroke = array('h')
+
+                self._history.append(QPixmap(self.canvas))
+                if len(self._history) > DOODLE_UNDO_LIMIT + 1:
+                    del self._history[0]
+
+    def _end_stroke_painter(self):
+        """Close the painter of the stroke in progress, if any"""
+        if self._stroke_painter is not None:
+            self._stroke_painter.end()
+            self._stroke_painter = None
 
     def get_drawing_data(self) -> DrawingData:
         """
@@ -129,6 +183,11 @@ class DoodleDialog(QDialog):
         self.width_spin.valueChanged.connect(self.canvas.set_pen_width)
         controls_layout.addWidget(self.width_spin)
 
+        # Undo button
+        undo_button = QPushButton("Undo")
+        undo_button.clicked.connect(self.canvas.undo)
+        controls_layout.addWidget(undo_button)
+
         # Clear button
         clear_button = QPushButton("Clear")
         clear_button.clicked.connect(self.canvas.clear_canvas)
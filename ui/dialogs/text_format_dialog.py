@@ -2,18 +2,27 @@
 Text formatting dialog
 """
 
-from PyQt5.QtWidgets import (QDialog, QLineEdit, QFontComboBox, QSpinBox,
+import functools
+
+from PyQt5.QtWidgets import (QDialog, QLineEdit, QComboBox, QSpinBox,
                              QCheckBox, QDialogButtonBox, QFormLayout,
                              QGroupBox, QVBoxLayout, QMessageBox, QPushButton,
                              QHBoxLayout, QColorDialog)
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtGui import QColor, QFontDatabase
 from PyQt5.QtCore import Qt
 from typing import Optional
 
-from core.constants import DEFAULT_FONT, DEFAULT_FONT_SIZE, MIN_FONT_SIZE, MAX_FONT_SIZE
+from core.constants import (DEFAULT_FONT, DEFAULT_FONT_SIZE, MIN_FONT_SIZE, MAX_FONT_SIZE,
+                            COMMON_FONTS, MORE_FONTS_LABEL)
 from models import TextFormat
 
 
+@functools.lru_cache(maxsize=None)
+def _installed_font_families() -> tuple:
+    """Enumerate installed font families once and share them between dialogs"""
+    return tuple(QFontDatabase().families())
+
+
 class TextFormatDialog(QDialog):
     """
     Dialog for text input with font formatting options.
@@ -44,9 +53,14 @@ class TextFormatDialog(QDialog):
         self.text_edit.setPlaceholderText("Enter text here...")
         form_layout.addRow("Text:", self.text_edit)
 
-        # Font selection
-        self.font_combo = QFontComboBox()
-        self.font_combo.setCurrentFont(QFont(format_obj.font_family))
+        # Font selection - a short list; every installed family is only
+        # enumerated if the user asks for more
+        self.font_combo = QComboBox()
+        self.font_combo.addItems(COMMON_FONTS)
+        self.font_combo.addItem(MORE_FONTS_LABEL)
+        self._font_family = None
+        self._select_font_family(format_obj.font_family)
+        self.font_combo.activated.connect(self._on_font_activated)
         form_layout.addRow("Font:", self.font_combo)
 
         # Font size
@@ -97,6 +111,56 @@ class TextFormatDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def reset(self) -> None:
+        """
+        Prepare the dialog to be shown again for a new annotation.
+
+        Clears the text but keeps the font, size, color and decorations
+        chosen last time, so consecutive annotations share a style.
+        """
+        self.text_edit.clear()
+        self.text_edit.setFocus()
+
+    def set_format(self, text_format: TextFormat) -> None:
+        """
+        Load a text format into the dialog, e.g. to edit an existing annotation.
+
+        Args:
+            text_format: TextFormat whose values fill the dialog's fields
+        """
+        self.text_edit.setText(text_format.text)
+        self._select_font_family(text_format.font_family)
+        self.size_spin.setValue(text_format.font_size)
+        self.current_color = QColor(*text_format.color)
+        self._update_color_button()
+        self.bold_check.setChecked(text_format.bold)
+        self.italic_check.setChecked(text_format.italic)
+        self.underline_check.setChecked(text_format.underline)
+        self.strikethrough_check.setChecked(text_format.strikethrough)
+        self.text_edit.setFocus()
+
+    def _select_font_family(self, family: str) -> None:
+        """Select a font family, adding it to the list if it isn't there yet"""
+        index = self.font_combo.findText(family)
+        if index < 0:
+            # Keep the "more" entry last
+            index = max(self.font_combo.findText(MORE_FONTS_LABEL), 0)
+            self.font_combo.insertItem(index, family)
+        self.font_combo.setCurrentIndex(index)
+        self._font_family = family
+
+    def _on_font_activated(self, index: int) -> None:
+        """Replace the "more" entry with every installed family when it is picked"""
+        if self.font_combo.itemText(index) != MORE_FONTS_LABEL:
+            self._font_family = self.font_combo.itemText(index)
+            return
+
+        self.font_combo.removeItem(index)
+        listed = {self.font_combo.itemText(i) for i in range(self.font_combo.count())}
+        self.font_combo.addItems([family for family in _installed_font_families() if family not in listed])
+        self._select_font_family(self._font_family)
+        self.font_combo.showPopup()
+
     def _choose_color(self):
         """Open color picker dialog"""
         color = QColorDialog.getColor(self.current_color, self, "Choose Text Color")
@@ -146,7 +210,7 @@ class TextFormatDialog(QDialog):
         """
         return TextFormat(
             text=self.text_edit.text().strip(),
-            font_family=self.font_combo.currentFont().family(),
+            font_family=self._font_family,
             font_size=self.size_spin.value(),
             bold=self.bold_check.isChecked(),
             italic=self.italic_check.isChecked(),
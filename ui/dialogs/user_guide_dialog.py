@@ -5,53 +5,13 @@ Displays comprehensive guide for using the PDF Editor
 
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QTextBrowser,
                              QPushButton, QHBoxLayout)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 from ui.styles import USER_GUIDE_STYLESHEET
 
 
-class UserGuideDialog(QDialog):
-    """Dialog displaying user guide with all features and usage instructions"""
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("Amar PDF - User Guide")
-        self.setMinimumSize(800, 600)
-        self.setup_ui()
-
-    def setup_ui(self):
-        """Setup the user interface"""
-        layout = QVBoxLayout(self)
-
-        # Set light background for the entire dialog (for dark mode compatibility)
-        self.setStyleSheet(USER_GUIDE_STYLESHEET)
-
-        # Create text browser for displaying guide
-        self.text_browser = QTextBrowser()
-        self.text_browser.setOpenExternalLinks(False)
-        self.text_browser.setHtml(self.get_guide_content())
-
-        # Set font
-        font = QFont()
-        font.setPointSize(11)
-        self.text_browser.setFont(font)
-
-        layout.addWidget(self.text_browser)
-
-        # Close button
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-
-        close_button = QPushButton("Close")
-        close_button.setMinimumWidth(100)
-        close_button.clicked.connect(self.accept)
-        button_layout.addWidget(close_button)
-
-        layout.addLayout(button_layout)
-
-    def get_guide_content(self):
-        """Returns the HTML content for the user guide"""
-        return """
+# Built once at import; every dialog reuses the same string
+_GUIDE_HTML = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -193,6 +153,7 @@ class UserGuideDialog(QDialog):
                             <li>Draw freely with mouse or stylus</li>
                             <li>Click <strong>Choose Color</strong> to change pen color</li>
                             <li>Adjust <strong>Pen Width</strong> (1-20 pixels)</li>
+                            <li>Click <strong>Undo</strong> to remove the last stroke</li>
                             <li>Click <strong>Clear</strong> to start over</li>
                         </ul>
                     </li>
@@ -422,3 +383,60 @@ class UserGuideDialog(QDialog):
         </body>
         </html>
         """
+
+
+class UserGuideDialog(QDialog):
+    """Dialog displaying user guide with all features and usage instructions"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Amar PDF - User Guide")
+        self.setMinimumSize(800, 600)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Setup the user interface"""
+        layout = QVBoxLayout(self)
+
+        # Set light background for the entire dialog (for dark mode compatibility)
+        self.setStyleSheet(USER_GUIDE_STYLESHEET)
+
+        # Create text browser for displaying guide
+        self.text_browser = QTextBrowser()
+        self.text_browser.setOpenExternalLinks(False)
+        # The guide itself is filled in once the dialog is on screen
+        self.text_browser.setPlainText("Loading...")
+        self._content_loaded = False
+
+        # Set font
+        font = QFont()
+        font.setPointSize(11)
+        self.text_browser.setFont(font)
+
+        layout.addWidget(self.text_browser)
+
+        # Close button
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        close_button = QPushButton("Close")
+        close_button.setMinimumWidth(100)
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+
+        layout.addLayout(button_layout)
+
+    def showEvent(self, event):
+        """Load the guide after the first show so the window paints right away"""
+        super().showEvent(event)
+        if not self._content_loaded:
+            self._content_loaded = True
+            QTimer.singleShot(0, self._load_content)
+
+    def _load_content(self):
+        """Lay out the guide HTML in the text browser"""
+        self.text_browser.setHtml(self.get_guide_content())
+
+    def get_guide_content(self):
+        """Returns the HTML content for the user guide"""
+        return _GUIDE_HTML
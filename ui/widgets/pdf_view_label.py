@@ -3,12 +3,15 @@ PDF View Label widget
 Custom label for displaying and interacting with PDF annotations
 """
 
+from collections import defaultdict
+
 from PyQt5.QtWidgets import QLabel, QDialog, QMenu, QMessageBox
 from PyQt5.QtGui import QPainter, QPen
-from PyQt5.QtCore import Qt, QPoint
+from PyQt5.QtCore import Qt, QPoint, QPointF, QTimer
 
 from core.enums import EditMode, ResizeEdge
-from core.constants import EDGE_RESIZE_THRESHOLD, MIN_ANNOTATION_SIZE
+from core.constants import (EDGE_RESIZE_THRESHOLD, MIN_ANNOTATION_SIZE, HIT_TEST_BIN_SIZE,
+                            HIT_TEST_GRID_MIN_ANNOTATIONS, REPAINT_MARGIN)
 from ui.dialogs import TextFormatDialog
 from models import TextAnnotation, ImageAnnotation, DoodleAnnotation, TextFormat
 
@@ -25,35 +28,158 @@ class PDFViewLabel(QLabel):
         self.resize_edge = None  # Which edge is being resized
         self.resize_start_pos = QPoint(0, 0)
         self.current_mode = None  # Will be set by parent editor
+        self._bboxes = []  # (left, top, right, bottom) per annotation at current zoom
+        self._bboxes_key = None
+        self._bins = None  # grid cell -> indices of annotations overlapping it, None below the threshold
+        self._update_pending = False
+        self._dirty_rect = None  # area to repaint on the pending update, None for all
+        self._border_pen = QPen(Qt.blue, 2, Qt.DashLine)  # shared by every annotation's border
+        self._edit_dialog = None  # TextFormatDialog reused for editing text annotations
         self.setMouseTracking(True)  # Enable mouse tracking to update cursor on hover
 
+    def invalidate_geometry(self):
+        """Drop cached annotation bounds after annotations were moved, resized or edited"""
+        self._bboxes_key = None
+
+    def request_update(self, rect=None):
+        """
+        Schedule a repaint for the end of the current event-loop turn.
+
+        Any number of requests made while handling one event (page change,
+        annotation add, edit) collapse into a single update() call.
+
+        Args:
+            rect: Area that changed, or None to repaint the whole label
+        """
+        if not self._update_pending:
+            self._update_pending = True
+            self._dirty_rect = rect
+            QTimer.singleShot(0, self._flush_update)
+        elif self._dirty_rect is not None:
+            self._dirty_rect = None if rect is None else self._dirty_rect.united(rect)
+
+    def _flush_update(self):
+        """Issue the repaint scheduled by request_update()"""
+        self._update_pending = False
+        if self._dirty_rect is None:
+            self.update()
+        else:
+            self.update(self._dirty_rect)
+            self._dirty_rect = None
+
+    def annotation_repaint_rect(self, annotation):
+        """Get the label area an annotation paints, including its dashed border"""
+        return annotation.get_rect(self.zoom_level).adjusted(
+            -REPAINT_MARGIN, -REPAINT_MARGIN, REPAINT_MARGIN, REPAINT_MARGIN)
+
+    def _annotation_bboxes(self):
+        """
+        Get annotation bounding boxes at the current zoom level.
+
+        Boxes are computed once per annotation list / zoom level and reused by
+        hit-testing, so a click doesn't re-measure every text annotation. On
+        pages with at least HIT_TEST_GRID_MIN_ANNOTATIONS annotations, each box
+        is also registered in every HIT_TEST_BIN_SIZE grid cell it overlaps.
+        """
+        key = (id(self.annotations), len(self.annotations), self.zoom_level)
+        if self._bboxes_key != key:
+            self._bboxes = []
+            self._bins = defaultdict(list) if len(self.annotations) >= HIT_TEST_GRID_MIN_ANNOTATIONS else None
+            for index, annotation in enumerate(self.annotations):
+                rect = annotation.get_rect(self.zoom_level)
+                left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
+                self._bboxes.append((left, top, right, bottom))
+                if self._bins is None:
+                    continue
+                for bx in range(left // HIT_TEST_BIN_SIZE, right // HIT_TEST_BIN_SIZE + 1):
+                    for by in range(top // HIT_TEST_BIN_SIZE, bottom // HIT_TEST_BIN_SIZE + 1):
+                        self._bins[(bx, by)].append(index)
+            self._bboxes_key = key
+        return self._bboxes
+
+    def annotation_at(self, x, y):
+        """
+        Find the annotation under a point in label coordinates.
+
+        Args:
+            x: X coordinate in label space
+            y: Y coordinate in label space
+
+        Returns:
+            First annotation containing the point, or None
+        """
+        bboxes = self._annotation_bboxes()
+
+        # Only annotations overlapping the point's grid cell can contain it; their
+        # indices are in list order, so the first hit matches a full scan
+        if self._bins is None:
+            candidates = range(len(bboxes))
+        else:
+            candidates = self._bins.get((int(x // HIT_TEST_BIN_SIZE), int(y // HIT_TEST_BIN_SIZE)), ())
+        for index in candidates:
+            left, top, right, bottom = bboxes[index]
+            if left <= x <= right and top <= y <= bottom:
+                return self.annotations[index]
+        return None
+
+    def _annotations_near(self, x, y, margin=0):
+        """
+        Get the annotations whose grid cells lie within margin of a point.
+
+        Args:
+            x: X coordinate in label space
+            y: Y coordinate in label space
+            margin: Distance around the point to include, in label pixels
+
+        Returns:
+            Candidate annotations in list order (a superset of those near the point)
+        """
+        self._annotation_bboxes()
+        if self._bins is None:
+            return self.annotations
+
+        indices = set()
+        for bx in range(int((x - margin) // HIT_TEST_BIN_SIZE), int((x + margin) // HIT_TEST_BIN_SIZE) + 1):
+            for by in range(int((y - margin) // HIT_TEST_BIN_SIZE), int((y + margin) // HIT_TEST_BIN_SIZE) + 1):
+                indices.update(self._bins.get((bx, by), ()))
+        return [self.annotations[index] for index in sorted(indices)]
+
     def paintEvent(self, event):
         super().paintEvent(event)
 
         if not self.annotations:
             return
 
+        # Only annotations touching the exposed area are painted, so the targeted
+        # repaints from request_update() don't redraw the whole page's annotations
         painter = QPainter(self)
+        self._paint_annotations(painter, event.rect())
+        painter.end()
+
+    def _paint_annotations(self, painter, exposed):
+        """Paint the page's annotations that intersect the exposed rect"""
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Draw each draft annotation with zoom level
         for annotation in self.annotations:
+            if not self.annotation_repaint_rect(annotation).intersects(exposed):
+                continue
             rect = annotation.get_rect(self.zoom_level)
 
             if isinstance(annotation, TextAnnotation):
                 # Draw dashed border
-                pen = QPen(Qt.blue, 2, Qt.DashLine)
-                painter.setPen(pen)
+                painter.setPen(self._border_pen)
                 painter.drawRect(rect)
 
                 # Draw text with formatting at zoom level
                 font = annotation.get_qfont(self.zoom_level)
                 painter.setFont(font)
                 # Use annotation color
-                text_color = annotation.get_qcolor()
-                pen = QPen(text_color)
-                painter.setPen(pen)
-                painter.drawText(rect.adjusted(5, 0, -5, 0), Qt.AlignLeft | Qt.AlignVCenter, annotation.text)
+                painter.setPen(annotation.get_qcolor())
+                # Left-aligned with 5px padding and vertically centred, from the cached layout
+                static_text = annotation.get_static_text(self.zoom_level)
+                text_top = rect.top() + (rect.height() - static_text.size().height()) / 2
+                painter.drawStaticText(QPointF(rect.left() + 5, text_top), static_text)
 
             elif isinstance(annotation, ImageAnnotation):
                 # Draw the image
@@ -61,8 +187,7 @@ class PDFViewLabel(QLabel):
                 painter.drawPixmap(rect.topLeft(), scaled_pixmap)
 
                 # Draw dashed border
-                pen = QPen(Qt.blue, 2, Qt.DashLine)
-                painter.setPen(pen)
+                painter.setPen(self._border_pen)
                 painter.drawRect(rect)
 
             elif isinstance(annotation, DoodleAnnotation):
@@ -71,12 +196,9 @@ class PDFViewLabel(QLabel):
                 painter.drawPixmap(rect.topLeft(), scaled_pixmap)
 
                 # Draw dashed border
-                pen = QPen(Qt.blue, 2, Qt.DashLine)
-                painter.setPen(pen)
+                painter.setPen(self._border_pen)
                 painter.drawRect(rect)
 
-        painter.end()
-
     def get_resize_edge(self, annotation, x, y):
         """Check if point is near an edge for resizing (images and doodles)"""
         if not isinstance(annotation, (ImageAnnotation, DoodleAnnotation)):
@@ -99,33 +221,35 @@ class PDFViewLabel(QLabel):
 
     def mousePressEvent(self, event):
         # Check if clicking on existing annotation
-        for annotation in self.annotations:
-            if annotation.contains_point(event.x(), event.y(), self.zoom_level):
-                # Check if near edge for resizing (images only)
-                edge = self.get_resize_edge(annotation, event.x(), event.y())
-                if edge:
-                    self.resizing_annotation = annotation
-                    self.resize_edge = edge
-                    self.resize_start_pos = QPoint(event.x(), event.y())
-                    event.accept()
-                    return
-
-                # Otherwise start dragging
-                self.dragging_annotation = annotation
-                # Calculate scaled position for drag offset
-                zoom_ratio = self.zoom_level / annotation.created_at_zoom
-                scaled_x = annotation.x * zoom_ratio
-                scaled_y = annotation.y * zoom_ratio
-                self.drag_offset = QPoint(event.x() - int(scaled_x), event.y() - int(scaled_y))
+        x, y = event.x(), event.y()
+        annotation = self.annotation_at(x, y)
+        if annotation is not None:
+            # Check if near edge for resizing (images only)
+            edge = self.get_resize_edge(annotation, x, y)
+            if edge:
+                self.resizing_annotation = annotation
+                self.resize_edge = edge
+                self.resize_start_pos = QPoint(x, y)
                 event.accept()
                 return
 
+            # Otherwise start dragging
+            self.dragging_annotation = annotation
+            # Calculate scaled position for drag offset
+            zoom_ratio = self.zoom_level / annotation.created_at_zoom
+            scaled_x = annotation.x * zoom_ratio
+            scaled_y = annotation.y * zoom_ratio
+            self.drag_offset = QPoint(x - int(scaled_x), y - int(scaled_y))
+            event.accept()
+            return
+
         # Pass to parent if not clicking on annotation
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
         if self.resizing_annotation:
             # Handle image resizing - keep resize cursor
+            old_rect = self.annotation_repaint_rect(self.resizing_annotation)
             zoom_ratio = self.zoom_level / self.resizing_annotation.created_at_zoom
             dx = event.x() - self.resize_start_pos.x()
             dy = event.y() - self.resize_start_pos.y()
@@ -153,26 +277,39 @@ class PDFViewLabel(QLabel):
                     self.resizing_annotation.height = new_height
                     self.resize_start_pos = QPoint(event.x(), event.y())
 
-            self.update()
+            # Repaint only the strip covering the annotation before and after the change
+            self.invalidate_geometry()
+            self.request_update(old_rect.united(self.annotation_repaint_rect(self.resizing_annotation)))
             event.accept()
         elif self.dragging_annotation:
             # Set closed hand cursor while dragging
             self.setCursor(Qt.ClosedHandCursor)
 
-            # Update position in the original zoom space
+            # Snap the position to whole device pixels; moves that land on the
+            # pixel the annotation already occupies change nothing
             zoom_ratio = self.zoom_level / self.dragging_annotation.created_at_zoom
-            new_x = (event.x() - self.drag_offset.x()) / zoom_ratio
-            new_y = (event.y() - self.drag_offset.y()) / zoom_ratio
-            self.dragging_annotation.x = new_x
-            self.dragging_annotation.y = new_y
-            self.update()
+            dpr = self.devicePixelRatioF()
+            pos = event.localPos()
+            device_x = round((pos.x() - self.drag_offset.x()) * dpr)
+            device_y = round((pos.y() - self.drag_offset.y()) * dpr)
+            if (device_x == round(self.dragging_annotation.x * zoom_ratio * dpr)
+                    and device_y == round(self.dragging_annotation.y * zoom_ratio * dpr)):
+                event.accept()
+                return
+
+            # Store the position in the original zoom space
+            old_rect = self.annotation_repaint_rect(self.dragging_annotation)
+            self.dragging_annotation.x = device_x / dpr / zoom_ratio
+            self.dragging_annotation.y = device_y / dpr / zoom_ratio
+            self.invalidate_geometry()
+            self.request_update(old_rect.united(self.annotation_repaint_rect(self.dragging_annotation)))
             event.accept()
         else:
             # Update cursor based on hover position and mode
             cursor_set = False
 
             # Check for image/doodle resize edges first (highest priority)
-            for annotation in self.annotations:
+            for annotation in self._annotations_near(event.x(), event.y(), EDGE_RESIZE_THRESHOLD):
                 if isinstance(annotation, (ImageAnnotation, DoodleAnnotation)):
                     edge = self.get_resize_edge(annotation, event.x(), event.y())
                     if edge in (ResizeEdge.LEFT, ResizeEdge.RIGHT):
@@ -216,34 +353,9 @@ class PDFViewLabel(QLabel):
 
     def mouseDoubleClickEvent(self, event):
         # Check if double-clicking on existing text annotation to edit
-        for annotation in self.annotations:
+        for annotation in self._annotations_near(event.x(), event.y()):
             if isinstance(annotation, TextAnnotation) and annotation.contains_point(event.x(), event.y(), self.zoom_level):
-                # Create TextFormat from annotation properties
-                initial_format = TextFormat(
-                    text=annotation.text,
-                    font_family=annotation.font_family,
-                    font_size=annotation.font_size,
-                    bold=annotation.bold,
-                    italic=annotation.italic,
-                    underline=annotation.underline,
-                    strikethrough=annotation.strikethrough,
-                    color=annotation.color
-                )
-
-                dialog = TextFormatDialog(self, initial_format=initial_format)
-                if dialog.exec_() == QDialog.Accepted:
-                    text_format = dialog.get_values()
-                    if text_format.is_valid():
-                        annotation.text = text_format.text
-                        annotation.font_family = text_format.font_family
-                        annotation.font_size = text_format.font_size
-                        annotation.bold = text_format.bold
-                        annotation.italic = text_format.italic
-                        annotation.underline = text_format.underline
-                        annotation.strikethrough = text_format.strikethrough
-                        annotation.color = text_format.color
-                        annotation.update_bounds()
-                        self.update()
+                self._edit_annotation(annotation, event.x(), event.y())
                 event.accept()
                 return
 
@@ -252,11 +364,7 @@ class PDFViewLabel(QLabel):
     def contextMenuEvent(self, event):
         """Handle right-click context menu for annotations"""
         # Check if right-clicking on an annotation
-        clicked_annotation = None
-        for annotation in self.annotations:
-            if annotation.contains_point(event.x(), event.y(), self.zoom_level):
-                clicked_annotation = annotation
-                break
+        clicked_annotation = self.annotation_at(event.x(), event.y())
 
         if clicked_annotation:
             # Create context menu
@@ -278,7 +386,7 @@ class PDFViewLabel(QLabel):
             super().contextMenuEvent(event)
 
     def _edit_annotation(self, annotation, x, y):
-        """Edit a text annotation (same as double-click)"""
+        """Edit a text annotation (double-click or context menu Edit)"""
         if isinstance(annotation, TextAnnotation):
             # Create TextFormat from annotation properties
             initial_format = TextFormat(
@@ -292,10 +400,15 @@ class PDFViewLabel(QLabel):
                 color=annotation.color
             )
 
-            dialog = TextFormatDialog(self, initial_format=initial_format)
+            # One dialog is built on first edit and reused afterwards
+            if self._edit_dialog is None:
+                self._edit_dialog = TextFormatDialog(self)
+            dialog = self._edit_dialog
+            dialog.set_format(initial_format)
             if dialog.exec_() == QDialog.Accepted:
                 text_format = dialog.get_values()
                 if text_format.is_valid():
+                    old_rect = self.annotation_repaint_rect(annotation)
                     annotation.text = text_format.text
                     annotation.font_family = text_format.font_family
                     annotation.font_size = text_format.font_size
@@ -305,7 +418,8 @@ class PDFViewLabel(QLabel):
                     annotation.strikethrough = text_format.strikethrough
                     annotation.color = text_format.color
                     annotation.update_bounds()
-                    self.update()
+                    self.invalidate_geometry()
+                    self.request_update(old_rect.united(self.annotation_repaint_rect(annotation)))
 
     def _delete_annotation(self, annotation):
         """Delete an annotation with confirmation"""
@@ -319,15 +433,16 @@ class PDFViewLabel(QLabel):
         )
 
         if reply == QMessageBox.Yes:
-            # Remove from local list
+            # Remove from the editor's drafts. The label sits inside a scroll
+            # area, so the editor is its window rather than its parent.
+            editor = self.window()
+            if hasattr(editor, 'remove_draft_annotation'):
+                editor.remove_draft_annotation(annotation)
+
+            # Remove from local list (when it isn't the editor's page bucket)
             if annotation in self.annotations:
                 self.annotations.remove(annotation)
 
-            # Remove from parent's draft annotations
-            parent = self.parent()
-            if parent and hasattr(parent, 'draft_annotations'):
-                if annotation in parent.draft_annotations:
-                    parent.draft_annotations.remove(annotation)
-
-            # Refresh display
-            self.update()
+            # Refresh the area the annotation covered
+            self.invalidate_geometry()
+            self.request_update(self.annotation_repaint_rect(annotation))
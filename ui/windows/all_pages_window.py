@@ -245,14 +245,11 @@ class AllPagesWindow(QMainWindow, PDFOperations):
                     new_annotations.append(annotation)
 
             self.parent_editor.draft_annotations = new_annotations
+            self.parent_editor.reindex_draft_annotations()
 
         # Replace original document
         if self.parent_editor and hasattr(self.parent_editor, 'doc'):
-            self.parent_editor.doc.close()
-            self.parent_editor.doc = new_doc
-            self.parent_editor.current_page = 0
-            self.parent_editor.show_page(0)
-            self.parent_editor.update_buttons()
+            self.parent_editor.replace_document(new_doc)
 
         # Clean up temp file
         self.doc.close()